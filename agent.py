@@ -1,18 +1,22 @@
-import constants, os, torch
+import constants, copy, os, threading, torch
 import torch.nn as nn
 import torch.optim as optim
 import numpy as np
-from collections import deque
 from core.game import Environment
+from memory import ReplayBuffer, PrioritizedReplayBuffer, NStepWindow
+from inference import select_backend, build_backend, export_policy
+from utils.Profiling import Profiler
+from utils.Metrics import MetricsWriter
 
 class QNetwork(nn.Module):
-    def __init__(self, state_size: int, action_size: int):
+    def __init__(self, state_size: int, action_size: int, hidden_nodes: int = None):
         super(QNetwork, self).__init__()
-        self.fc1 = nn.Linear(state_size, constants.HL_NODES)
-        self.fc2 = nn.Linear(constants.HL_NODES, constants.HL_NODES)
-        self.fc3 = nn.Linear(constants.HL_NODES, constants.HL_NODES)
-        self.fc4 = nn.Linear(constants.HL_NODES, constants.HL_NODES)
-        self.fc5 = nn.Linear(constants.HL_NODES, action_size)
+        hidden_nodes = hidden_nodes or constants.HL_NODES
+        self.fc1 = nn.Linear(state_size, hidden_nodes)
+        self.fc2 = nn.Linear(hidden_nodes, hidden_nodes)
+        self.fc3 = nn.Linear(hidden_nodes, hidden_nodes)
+        self.fc4 = nn.Linear(hidden_nodes, hidden_nodes)
+        self.fc5 = nn.Linear(hidden_nodes, action_size)
 
     def forward(self, x) -> nn.Linear:
         """Feed Forward"""
@@ -24,8 +28,49 @@ class QNetwork(nn.Module):
         return y
 
 
+class ConvQNetwork(nn.Module):
+    """Q-Values from Stacked Grayscale Frames (core.render.PixelRenderer) ; Input is Flat 0-255 Pixels"""
+    def __init__(self, frame_shape:tuple[int, int, int], action_size:int, hidden_nodes:int = None):
+        super(ConvQNetwork, self).__init__()
+        hidden_nodes = hidden_nodes or constants.HL_NODES
+        self.frame_shape = frame_shape      # (Stack, Height, Width)
+        self.conv1 = nn.Conv2d(frame_shape[0], 16, kernel_size=8, stride=4)
+        self.conv2 = nn.Conv2d(16, 32, kernel_size=4, stride=2)
+        with torch.no_grad():
+            features = self.features(torch.zeros((1, *frame_shape))).shape[1]
+        self.fc1 = nn.Linear(features, hidden_nodes)
+        self.fc2 = nn.Linear(hidden_nodes, action_size)
+
+    def features(self, x) -> torch.Tensor:
+        x = torch.relu(self.conv1(x))
+        x = torch.relu(self.conv2(x))
+        return x.flatten(1)
+
+    def forward(self, x) -> torch.Tensor:
+        """Feed Forward ; uint8 Batches from Memory & float Batches from act() are Both Scaled to [0, 1]"""
+        x = x.view(-1, *self.frame_shape).float() * (1 / 255)
+        x = torch.relu(self.fc1(self.features(x)))
+        return self.fc2(x)
+
+
+def flatten_parameters(module:nn.Module) -> nn.Parameter:
+    """Copy module's Parameters into One Contiguous Buffer & Rebind Each Parameter (and its Gradient) to a View of it"""
+    params = list(module.parameters())
+    flat = nn.Parameter(torch.cat([param.detach().reshape(-1) for param in params]))
+    flat.grad = torch.zeros_like(flat)
+    offset = 0
+    for param in params:
+        size = param.numel()
+        param.data = flat.data[offset:offset + size].view_as(param)
+        param.grad = flat.grad[offset:offset + size].view_as(param)
+        offset += size
+    return flat
+
+
 class QLearningAgent:
-    def __init__(self, state_size:int, action_size:int, assets_path:str, save_interval:int=500, memory_size:int=1000):
+    def __init__(self, state_size:int, action_size:int, assets_path:str, save_interval:int=500, memory_size:int=1000, config=constants, seed:int=None, network:str="mlp"):
+        ## Hyperparameters are Read from config ; the constants Module or a config.Config for Sweeps
+        self.config = config
         ## Paths
         self.assets_path:str = assets_path
         self.models_path:str = f"{self.assets_path}/models"
@@ -33,82 +78,185 @@ class QLearningAgent:
         ## Parameters
         self.state_size                     = state_size
         self.action_size                    = action_size
-        self.memory:deque                   = deque(maxlen=memory_size)
+        self.network:str                    = network     # "mlp": get_state Features ; "cnn": Stacked Pixel Frames
+        self.prioritized:bool               = self.config.PRIORITIZED_REPLAY
+        self.state_dtype:type               = np.uint8 if network == "cnn" else np.float32
+        if self.prioritized:
+            self.memory:ReplayBuffer        = PrioritizedReplayBuffer(memory_size, state_size, self.config.PER_ALPHA, self.config.PER_BETA, self.config.PER_BETA_INCREMENT, self.config.PER_EPSILON, state_dtype=self.state_dtype, gamma=self.config.AGENT_GAMMA)
+        else:
+            self.memory:ReplayBuffer        = ReplayBuffer(memory_size, state_size, state_dtype=self.state_dtype, gamma=self.config.AGENT_GAMMA)
+        # n-Step Returns ; Transitions Wait in a Window per Game until their n-th Reward (or the Game's End)
+        self.n_step:int                     = self.config.N_STEP
+        self.n_step_window:NStepWindow      = None
+        ## Randomness ; Exploration (self.rng) & Replay Sampling (memory.rng) Draw from Own Generators
+        self.rng:np.random.Generator        = None
+        self.set_seed(seed)
         ## HyperParameters
-        self.gamma:float                    = constants.AGENT_GAMMA
-        self.epsilon:float                  = constants.AGENT_EPSILON
-        self.epsilon_min:float              = constants.AGENT_EPSILON_MIN
-        self.epsilon_decay:float            = constants.AGENT_EPSILON_EXP_DECAY
-        self.epsilon_linear:float           = constants.AGENT_EPSILON_LINEAR_DECAY
-        self.initial_learning_rate:float    = constants.AGENT_INIT_LEARNING_RATE
-        self.min_learning_rate:float        = constants.AGENT_MIN_LEARNING_RATE
-        self.decay_iterations:float         = constants.AGENT_LEARNING_RATE_ITERATIONS
-
-        self.model = QNetwork(state_size, action_size)
-        self.target_model = QNetwork(state_size, action_size)
+        self.gamma:float                    = self.config.AGENT_GAMMA
+        self.epsilon:float                  = self.config.AGENT_EPSILON
+        self.epsilon_min:float              = self.config.AGENT_EPSILON_MIN
+        self.epsilon_decay:float            = self.config.AGENT_EPSILON_EXP_DECAY
+        self.epsilon_linear:float           = self.config.AGENT_EPSILON_LINEAR_DECAY
+        self.initial_learning_rate:float    = self.config.AGENT_INIT_LEARNING_RATE
+        self.min_learning_rate:float        = self.config.AGENT_MIN_LEARNING_RATE
+        self.decay_iterations:float         = self.config.AGENT_LEARNING_RATE_ITERATIONS
+        ## Update Schedule
+        self.train_every:int                = self.config.TRAIN_EVERY
+        self.gradient_steps_per_update:int  = self.config.GRADIENT_STEPS
+        self.learning_starts:int            = self.config.LEARNING_STARTS
+
+        with torch.random.fork_rng():       # Seeded Initial Weights without Touching the Global Torch Generator
+            if seed is not None:
+                torch.manual_seed(seed)
+            self.model = self.build_network()
+            self.target_model = self.build_network()
         self.target_model.load_state_dict(self.model.state_dict())
+        # Each Network's Parameters View One Flat Buffer ; RMSprop, Clipping & Target Updates are Single Tensor Ops
+        self.model_params:nn.Parameter = flatten_parameters(self.model)
+        self.target_params:nn.Parameter = flatten_parameters(self.target_model)
+        # Gradient-Free Forward for act/act_batch ; "auto" Times the Candidates, Seeded Runs Stay on Eager
+        backend = self.config.INFERENCE_BACKEND
+        if backend == "auto" and seed is None:
+            candidates = [name for name in self.config.INFERENCE_CANDIDATES if name != "numpy" or network == "mlp"]
+            self.inference_backend, self.policy = select_backend(self.model, state_size, candidates)
+        else:
+            self.inference_backend = "eager" if backend == "auto" else backend
+            self.policy = build_backend(self.inference_backend, self.model, state_size)
+        self.target_update_every:int = self.config.TARGET_UPDATE_EVERY
+        self.target_tau:float = self.config.TARGET_TAU
 
-        self.optimizer = optim.RMSprop(self.model.parameters(), lr=self.initial_learning_rate)
+        self.optimizer = optim.RMSprop([self.model_params], lr=self.initial_learning_rate)
         self.criterion = nn.MSELoss()
         self.save_interval:int = save_interval
+        self.save_thread:threading.Thread = None
+        self.saved_memory:dict[str,int] = {}    # Location -> memory.added at its Last Save
 
         ## Game Related Values
         self.num_games:int = 1
         self.top_score:int = 0
         self.last_score:int = 0
         self.all_scores: int = 0
+        self.profiler:Profiler = Profiler()     # Disabled ; Trainers Share their Own
+        self.metrics:MetricsWriter = None       # Per-Game Log ; Set by Trainers
+        self.game_loss:float = 0.0
+        self.game_updates:int = 0
+        self.env_steps:int = 0
+        self.gradient_steps:int = 0
+        self.update_learning_rate()
+
+    def build_network(self) -> nn.Module:
+        """QNetwork on State Features, or ConvQNetwork on FRAME_STACK x PIXEL_HEIGHT x PIXEL_WIDTH Frames"""
+        if self.network == "cnn":
+            frame_shape = (self.config.FRAME_STACK, self.config.PIXEL_HEIGHT, self.config.PIXEL_WIDTH)
+            return ConvQNetwork(frame_shape, self.action_size, self.config.HL_NODES)
+        return QNetwork(self.state_size, self.action_size, self.config.HL_NODES)
 
-        self.update_model = True
+    def set_seed(self, seed:int=None) -> None:
+        """Restart the Exploration & Replay Sampling Streams ; None Draws Fresh OS Entropy"""
+        explore_seed, sample_seed = np.random.SeedSequence(seed).spawn(2)
+        self.rng = np.random.default_rng(explore_seed)
+        self.memory.rng = np.random.default_rng(sample_seed)
 
-    def act(self, state:torch.Tensor) -> None:
+    def act(self, state:torch.Tensor) -> int:
         """Flap or Don't Flap"""
-        if np.random.rand() < self.epsilon:
-            return np.random.choice(self.action_size)
-        else:
-            state_tensor = torch.FloatTensor(state).unsqueeze(0)
-            q_values = self.model(state_tensor)
-            return torch.argmax(q_values).item()
+        if self.rng.random() < self.epsilon:
+            return int(self.rng.integers(self.action_size))
+        return int(self.policy(np.asarray(state, dtype=np.float32).reshape(1, -1)).argmax())
+
+    def act_batch(self, states:np.ndarray) -> np.ndarray:
+        """Epsilon-Greedy Actions for a Batch of States (e.g. VectorEnvironment.get_states())"""
+        n = len(states)
+        actions = self.policy(states).argmax(axis=1)
+        # Single Uniform Draw ; u < epsilon Explores, and u / epsilon is Again Uniform to Pick the Random Action
+        draws = self.rng.random(n)
+        explore = draws < self.epsilon
+        actions[explore] = (draws[explore] / self.epsilon * self.action_size).astype(actions.dtype)
+        return actions
 
     def remember(self, state:torch.Tensor, action:int, reward:float, next_state:torch.Tensor, done:bool) -> None:
         """Add frame to memory"""
-        self.memory.append((state, action, reward, next_state, done))
+        if self.n_step > 1:
+            self.remember_batch(
+                np.asarray(state, dtype=self.state_dtype)[None], np.array([action]), np.array([reward]),
+                np.asarray(next_state, dtype=self.state_dtype)[None], np.array([done])
+            )
+        else:
+            self.memory.add(state, action, reward, next_state, done)
+
+    def remember_batch(self, states:np.ndarray, actions:np.ndarray, rewards:np.ndarray, next_states:np.ndarray, dones:np.ndarray) -> None:
+        """Add One Step of n Games to memory ; Through their n-Step Windows when n_step > 1"""
+        if self.n_step == 1:
+            self.memory.add_batch(states, actions, rewards, next_states, dones)
+            return
+        if self.n_step_window is None or self.n_step_window.num_envs != len(states):
+            self.n_step_window = NStepWindow(len(states), self.n_step, self.gamma, self.state_size, self.state_dtype)
+        transitions = self.n_step_window.push(states, actions, rewards, next_states, dones)
+        if len(transitions[0]):
+            self.memory.add_batch(*transitions)
 
     def replay(self, batch_size:int=64) -> None:
         """Learning"""
         if len(self.memory) < batch_size:
             return
 
-        batch = [self.memory[idx] for idx in np.random.choice(len(self.memory), batch_size)]
-
-        states, actions, rewards, next_states, dones = zip(*batch)
-
-        states_tensor = torch.FloatTensor(np.array(states))
-        actions_tensor = torch.LongTensor(actions).unsqueeze(1)
-        rewards_tensor = torch.FloatTensor(rewards).unsqueeze(1)
-        next_states_tensor = torch.FloatTensor(np.array(next_states))
-        dones_tensor = torch.BoolTensor(dones).unsqueeze(1)
+        profiler = self.profiler
+        t = profiler.tick()
+        if self.prioritized:
+            batch, indices, weights = self.memory.sample(batch_size)
+        else:
+            batch = self.memory.sample(batch_size)
+        states_tensor, actions_tensor, rewards_tensor, next_states_tensor, dones_tensor, discounts_tensor = batch
+        t = profiler.add("replay.sample", t)
 
+        # Separate Online Passes ; Concatenating states & next_states Makes Backward Run over Both Halves
         q_values = self.model(states_tensor).gather(1, actions_tensor)
 
         with torch.no_grad():
-            next_action = torch.argmax(self.model(next_states_tensor), dim=1, keepdim=True)
-            next_q_values = self.target_model(next_states_tensor).gather(1, next_action)
-            target_q_values = rewards_tensor + (1 - dones_tensor.float()) * self.gamma * next_q_values
+            next_action = self.model(next_states_tensor).argmax(dim=1, keepdim=True)
+            next_q_values = self.target_model(next_states_tensor).gather(1, next_action).masked_fill_(dones_tensor, 0.0)
+            target_q_values = rewards_tensor + discounts_tensor * next_q_values     # gamma^n, Stored per Row
 
-        loss = self.criterion(q_values, target_q_values)
-
-        self.update_learning_rate()
+        if self.prioritized:
+            # Importance-Sampling Weighted MSE ; TD Errors Become the New Priorities
+            td_errors = target_q_values - q_values
+            loss = (weights * td_errors.pow(2)).mean()
+            self.memory.update_priorities(indices, td_errors.detach().squeeze(1).numpy())
+        else:
+            loss = self.criterion(q_values, target_q_values)
+        self.game_loss += loss.item()
+        self.game_updates += 1
+        t = profiler.add("replay.forward", t)
 
-        self.optimizer.zero_grad()
+        self.optimizer.zero_grad(set_to_none=False)     # Gradient Buffers are Kept & Reused
         loss.backward()
-        torch.nn.utils.clip_grad_norm_(self.model.parameters(), max_norm=1.0)
+        self.clip_gradients(max_norm=1.0)
+        t = profiler.add("replay.backward", t)
         self.optimizer.step()
+        self.gradient_steps += 1
+        self.update_target_model()
+        profiler.add("replay.optimizer", t)
+
+    @torch.no_grad()
+    def clip_gradients(self, max_norm:float) -> None:
+        """clip_grad_norm_ on the Flat Gradient Buffer, Scaled In Place"""
+        grad = self.model_params.grad
+        grad.mul_(torch.clamp(max_norm / (torch.linalg.vector_norm(grad) + 1e-6), max=1.0))
+
+    @torch.no_grad()
+    def update_target_model(self) -> None:
+        """Polyak Average Every Step if target_tau > 0, Else Hard Sync Every target_update_every Steps ; In Place"""
+        if self.target_tau > 0:
+            self.target_params.lerp_(self.model_params, self.target_tau)
+        elif self.gradient_steps % self.target_update_every == 0:
+            self.sync_target_model()
 
-        if self.num_games % constants.UPDATE_MODEL_DICT_EVERY == 0:
-            self.target_model.load_state_dict(self.model.state_dict())
+    @torch.no_grad()
+    def sync_target_model(self) -> None:
+        """Copy Online Weights into the Target Network"""
+        self.target_params.copy_(self.model_params)
 
     def update_learning_rate(self) -> None:
-        """Dynamic Changing of Learning Rate"""
+        """Dynamic Changing of Learning Rate ; Depends only on num_games, so Set Once per Game"""
         current_learning_rate = max(
             self.min_learning_rate,
             self.initial_learning_rate * np.exp(-self.num_games / self.decay_iterations)
@@ -118,9 +266,33 @@ class QLearningAgent:
 
     def update_agent(self, game:Environment, state: torch.Tensor, action: int, reward: int, next_state: torch.Tensor) -> None:
         """Update Agent's Memory ; Remembers / Learns Experience"""
-        self.remember(state, action, reward, next_state, not game.run)
-        if self.top_score < constants.STOP_NEW_LEARNING_AFTER_SCORE:
-            self.replay(batch_size=constants.BATCH_SIZE)
+        self.observe(state, action, reward, next_state, not game.run)
+
+    def observe(self, state, action:int, reward:float, next_state, done:bool) -> None:
+        """update_agent for Any Engine ; Takes done Instead of the Game"""
+        self.remember(state, action, reward, next_state, done)
+        self.env_steps += 1
+        if self.should_learn():
+            for _ in range(self.gradient_steps_per_update):
+                self.replay(batch_size=self.config.BATCH_SIZE)
+
+    def observe_batch(self, states:np.ndarray, actions:np.ndarray, rewards:np.ndarray, next_states:np.ndarray, dones:np.ndarray) -> None:
+        """observe for n Envs Stepped Together ; Same Number of Updates as n Single Steps"""
+        n = len(states)
+        self.remember_batch(states, actions, rewards, next_states, dones)
+        updates = (self.env_steps + n) // self.train_every - self.env_steps // self.train_every
+        self.env_steps += n
+        if updates and self.top_score < self.config.STOP_NEW_LEARNING_AFTER_SCORE and len(self.memory) >= self.learning_starts:
+            for _ in range(updates * self.gradient_steps_per_update):
+                self.replay(batch_size=self.config.BATCH_SIZE)
+
+    def should_learn(self) -> bool:
+        """Learn Every train_every Env Steps, Once Memory is Warmed Up & Until the Score Goal"""
+        return (
+            self.top_score < self.config.STOP_NEW_LEARNING_AFTER_SCORE
+            and self.env_steps % self.train_every == 0
+            and len(self.memory) >= self.learning_starts
+        )
 
     def update_scores(self, current_score:int) -> None:
         """Update both Last/Top Scores for Further Usage"""
@@ -130,15 +302,27 @@ class QLearningAgent:
 
     def update_game_record(self, game:Environment) -> None:
         """After each game, reset/update all variables"""
-        self.last_score = game.score
-        self.all_scores += game.score
-        self.top_score = max(self.top_score, game.score)
+        self.record_game(game.score, game.frames)
+
+    def record_game(self, score:int, frames:int) -> None:
+        """update_game_record for Any Engine ; Takes the Finished Game's Score & Frames"""
+        self.last_score = score
+        self.all_scores += score
+        self.top_score = max(self.top_score, score)
+        if self.metrics:
+            self.metrics.add(
+                self.num_games, score, self.all_scores / self.num_games, self.epsilon, self.optimizer.param_groups[0]['lr'],
+                self.game_loss / max(self.game_updates, 1), len(self.memory), frames
+            )
+        self.game_loss, self.game_updates = 0.0, 0
         self.num_games += 1
+        self.update_learning_rate()
         # Testing with both Exponential/Linear Decay
         self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
         # self.epsilon = max(self.epsilon_min, self.epsilon - self.epsilon_linear)
-        self.print_scores_and_info()
-        self.update_model = True
+        if self.config.PRINT_SCORES:
+            self.print_scores_and_info()
+        self.save_checkpoint()
 
     def print_scores_and_info(self) -> None:
         """Terminal Information; Centralized to Add/Remove Desired Info"""
@@ -147,35 +331,88 @@ class QLearningAgent:
             f"Top Score: {self.top_score} ; " +
             f"Last Score: {self.last_score} ; " +
             f"Epsilon: {self.epsilon:.6f} ; " +
-            f"Memory size: {len(self.memory)}"
+            f"Memory size: {len(self.memory)} ; " +
+            f"Env Steps: {self.env_steps} ; " +
+            f"Gradient Steps: {self.gradient_steps}"
         )
 
-    def save_model(self, location:str) -> None:
-        """Save Model to later Re-use"""
+    def save_model(self, location:str, background:bool=False) -> None:
+        """Save Model to later Re-use ; Weights in a .pth, Replay Memory as Raw Arrays in location/memory
+        Only Rows Added Since the Last Save to location are Written ; background=True Writes from a Thread"""
+        if not os.path.isdir(location):
+            print(f"Can't Save Model, Folder {location} does not exist.")
+            return
+        self.wait_for_save()
+        # Snapshot on the Training Thread so the Writer Never Sees Half-Updated State
+        indices, rows, meta = self.memory.snapshot(self.saved_memory.get(location, self.memory.added - self.memory.capacity))
+        checkpoint = {
+            'model_state_dict': {name: value.clone() for name, value in self.model.state_dict().items()},
+            'optimizer_state_dict': copy.deepcopy(self.optimizer.state_dict()),
+            'num_games': self.num_games,
+            'top_score': self.top_score,
+            'epsilon': self.epsilon,
+            'env_steps': self.env_steps,
+            'gradient_steps': self.gradient_steps,
+        }
+        self.saved_memory[location] = self.memory.added
+        if background:
+            self.save_thread = threading.Thread(target=self.write_checkpoint, args=(location, checkpoint, indices, rows, meta))
+            self.save_thread.start()
+        else:
+            self.write_checkpoint(location, checkpoint, indices, rows, meta)
+
+    def write_checkpoint(self, location:str, checkpoint:dict, indices:np.ndarray, rows:dict[str, np.ndarray], meta:dict) -> None:
+        """Memory Rows First, then the .pth through a Temp File & Atomic Rename"""
         try:
-            torch.save({
-                'model_state_dict': self.model.state_dict(),
-                'optimizer_state_dict': self.optimizer.state_dict(),
-                'memory': self.memory,
-                'num_games': self.num_games,
-                'top_score': self.top_score,
-                'epsilon': self.epsilon,
-            }, f'{location}/{constants.MODEL_NAME["file"]}.pth')
+            self.memory.write_snapshot(f"{location}/memory", indices, rows, meta)
+            file = f'{location}/{self.config.MODEL_NAME["file"]}'
+            if self.network == "mlp":     # Standalone NumPy Policy for Demos & Evaluation
+                export_policy(checkpoint['model_state_dict'], f"{file}.npz.tmp")
+                os.replace(f"{file}.npz.tmp", f"{file}.npz")
+            torch.save(checkpoint, f"{file}.pth.tmp")
+            os.replace(f"{file}.pth.tmp", f"{file}.pth")
             print("Model saved!")
-        except:
-            print(f"Can't Save Model, Folder {location} does not exist.")
+        except Exception as error:
+            self.saved_memory.pop(location, None)   # Next Save Rewrites Every Row
+            print(f"Can't Save Model to {location}: {error}")
+
+    def wait_for_save(self) -> None:
+        """Block until a Background Save Finished"""
+        if self.save_thread is not None:
+            self.save_thread.join()
+            self.save_thread = None
+
+    def save_checkpoint(self) -> None:
+        """Periodic Background Save into models/CHECKPOINT_FOLDER, Every save_interval Games"""
+        if not self.config.SAVE_MODEL or not self.save_interval or self.num_games % self.save_interval != 0:
+            return
+        location = f"{self.models_path}/{self.config.CHECKPOINT_FOLDER}"
+        os.makedirs(location, exist_ok=True)
+        self.save_model(location, background=True)
 
     def load_model(self) -> None:
         """Load Previous Model if it Exists"""
         try:
-            if os.path.exists(f'{self.models_path}/{constants.MODEL_NAME["folder"]}/'):
-                checkpoint = torch.load(f'{self.models_path}/{constants.MODEL_NAME["folder"]}/{constants.MODEL_NAME["file"]}.pth')
+            location = f'{self.models_path}/{self.config.MODEL_NAME["folder"]}'
+            if os.path.exists(f'{location}/'):
+                checkpoint = torch.load(f'{location}/{self.config.MODEL_NAME["file"]}.pth', weights_only=False)
                 self.model.load_state_dict(checkpoint['model_state_dict'])
-                self.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
-                self.memory = checkpoint['memory']
+                self.sync_target_model()
+                try:
+                    self.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
+                except ValueError:      # Saved before Parameters were Flattened ; One State per Layer
+                    print("Optimizer State not Compatible, Starting Fresh")
+                if 'memory' in checkpoint:      # Older Checkpoints Pickled the Whole Memory
+                    for transition in checkpoint['memory']:
+                        self.memory.add(*transition)
+                elif os.path.exists(f'{location}/memory/meta.json') and self.memory.load(f'{location}/memory'):
+                    self.saved_memory[location] = self.memory.added
                 self.num_games = checkpoint['num_games']
                 self.top_score = checkpoint['top_score']
                 self.epsilon = checkpoint['epsilon']
+                self.env_steps = checkpoint.get('env_steps', 0)
+                self.gradient_steps = checkpoint.get('gradient_steps', 0)
+                self.update_learning_rate()
                 print("Model loaded!")
             else:
                 print("Path does not Exist")
@@ -0,0 +1,207 @@
+import argparse, os, queue, shutil, time
+import numpy as np
+import torch
+import torch.multiprocessing as mp
+import constants
+from agent import QLearningAgent, QNetwork
+from core.game import Environment as Env, ActionRepeat
+from inference import NumpyQNetwork
+from memory import NStepWindow
+
+# Transition Chunk Row Layout ; state | action | reward | next_state | done | discount
+STATE = slice(0, constants.INPUT)
+ACTION = constants.INPUT
+REWARD = constants.INPUT + 1
+NEXT_STATE = slice(constants.INPUT + 2, 2 * constants.INPUT + 2)
+DONE = 2 * constants.INPUT + 2
+DISCOUNT = 2 * constants.INPUT + 3
+ROW_SIZE = 2 * constants.INPUT + 4
+
+
+def actor_epsilon(actor_id:int, num_actors:int) -> float:
+    """Ape-X Exploration Ladder ; Actor 0 Explores Most, Last Actor is Nearly Greedy"""
+    if num_actors == 1:
+        return constants.APEX_EPSILON
+    return constants.APEX_EPSILON ** (1 + actor_id / (num_actors - 1) * constants.APEX_EPSILON_ALPHA)
+
+
+def actor_loop(actor_id:int, epsilon:float, shared_model:QNetwork, version, lock, transitions, scores, stop) -> None:
+    """Play Games with a CPU Copy of the Network & Stream Transition Chunks to the Learner"""
+    torch.set_num_threads(1)
+    rng = np.random.default_rng()
+    model = QNetwork(constants.INPUT, constants.OUTPUT)
+    policy = NumpyQNetwork.from_model(model)     # Views of model's Weights ; load_state_dict Updates it In Place
+    local_version = -1
+    chunk = np.zeros((constants.APEX_SEND_EVERY, ROW_SIZE), dtype=np.float32)
+    filled = 0
+    # Each Actor Sums its Own n-Step Returns, so Chunks from Every Actor Mix Freely in the Learner's Buffer
+    window = NStepWindow(1, constants.N_STEP, constants.AGENT_GAMMA, constants.INPUT) if constants.N_STEP > 1 else None
+
+    def send(state, action:int, reward:float, next_state, done:bool, discount:float) -> None:
+        nonlocal filled
+        row = chunk[filled]
+        row[STATE] = state
+        row[ACTION] = action
+        row[REWARD] = reward
+        row[NEXT_STATE] = next_state
+        row[DONE] = done
+        row[DISCOUNT] = discount
+        filled += 1
+        if filled == constants.APEX_SEND_EVERY:
+            transitions.put(torch.from_numpy(chunk.copy()))
+            filled = 0
+
+    while not stop.is_set():
+        game = Env()
+        env = ActionRepeat(game, constants.ACTION_REPEAT)
+        while game.run and not stop.is_set():
+            if local_version != version.value:
+                with lock:
+                    model.load_state_dict(shared_model.state_dict())
+                    local_version = version.value
+
+            state = game.get_state()
+            if rng.random() < epsilon:
+                action = int(rng.integers(constants.OUTPUT))
+            else:
+                action = policy.act(state)
+            reward = env.step(action)
+
+            if window is None:
+                send(state, action, reward, game.get_state(), not game.run, constants.AGENT_GAMMA)
+            else:
+                for transition in zip(*window.push([state], [action], [reward], np.array([game.get_state()]), np.array([not game.run]))):
+                    send(*transition)
+        if not game.run:
+            scores.put((actor_id, game.score, game.frames))
+
+
+class ApeX:
+    """Single Learner Fed by Several Actor Processes ; Weights Broadcast through Shared Memory"""
+    def __init__(self, num_actors:int=constants.APEX_NUM_ACTORS):
+        self.assets_path:str = os.path.dirname(os.path.abspath(__file__)) + "/assets"
+        self.num_actors:int = num_actors
+        self.agent = QLearningAgent(
+            state_size=constants.INPUT,
+            action_size=constants.OUTPUT,
+            assets_path=self.assets_path,
+            save_interval=constants.SAVE_INTERVAL,
+            memory_size=constants.MEMORY_SIZE
+        )
+        if constants.LOAD_MODEL:
+            self.agent.load_model()
+
+        ctx = mp.get_context("spawn")
+        self.shared_model = QNetwork(constants.INPUT, constants.OUTPUT)
+        self.shared_model.load_state_dict(self.agent.model.state_dict())
+        self.shared_model.share_memory()
+        self.version = ctx.Value("i", 0)
+        self.lock = ctx.Lock()
+        self.transitions = ctx.Queue(maxsize=num_actors * 16)     # Back-Pressure on Actors Running Ahead
+        self.scores = ctx.Queue()
+        self.stop = ctx.Event()
+        self.actors = [
+            ctx.Process(
+                target=actor_loop,
+                args=(i, actor_epsilon(i, num_actors), self.shared_model, self.version, self.lock, self.transitions, self.scores, self.stop),
+                daemon=True
+            )
+            for i in range(num_actors)
+        ]
+
+        self.total_frames:int = 0
+
+    def broadcast_weights(self) -> None:
+        """Copy Learner Weights into the Shared Model In Place"""
+        with self.lock:
+            with torch.no_grad():
+                for shared, param in zip(self.shared_model.parameters(), self.agent.model.parameters()):
+                    shared.copy_(param)
+            self.version.value += 1
+
+    def store(self, chunk:torch.Tensor) -> None:
+        """Write a Transition Chunk into Replay Memory"""
+        chunk = chunk.numpy()
+        self.agent.memory.add_batch(chunk[:, STATE], chunk[:, ACTION], chunk[:, REWARD], chunk[:, NEXT_STATE], chunk[:, DONE] > 0.5, chunk[:, DISCOUNT])
+
+    def drain(self, block:bool=False) -> None:
+        """Pull Waiting Transition Chunks ; Bounded so the Learner Keeps Training"""
+        for _ in range(self.num_actors * 4):
+            try:
+                self.store(self.transitions.get(timeout=0.1) if block else self.transitions.get_nowait())
+            except queue.Empty:
+                break
+            block = False
+
+    def record_games(self) -> None:
+        """Scores of Games Finished by Actors"""
+        while True:
+            try:
+                actor_id, score, frames = self.scores.get_nowait()
+            except queue.Empty:
+                return
+            self.total_frames += frames
+            self.agent.env_steps += frames
+            self.agent.all_scores += score
+            self.agent.update_scores(score)
+            self.agent.num_games += 1
+            self.agent.update_learning_rate()
+            print(
+                f"Iteration: {self.agent.num_games} ; " +
+                f"Actor: {actor_id} ; " +
+                f"Top Score: {self.agent.top_score} ; " +
+                f"Last Score: {score} ; " +
+                f"Memory size: {len(self.agent.memory)} ; " +
+                f"Gradient Steps: {self.agent.gradient_steps}"
+            )
+
+    def train(self, num_games:int=constants.TRAIN_X_ITER) -> None:
+        """Learn Continuously from Actor Transitions until num_games are Played"""
+        for actor in self.actors:
+            actor.start()
+        start = time.perf_counter()
+        try:
+            while self.agent.num_games < num_games:
+                learning = len(self.agent.memory) >= constants.BATCH_SIZE and self.agent.top_score < constants.STOP_NEW_LEARNING_AFTER_SCORE
+                self.drain(block=not learning)
+                self.record_games()
+                if learning:
+                    self.agent.replay(batch_size=constants.BATCH_SIZE)
+                    if self.agent.gradient_steps % constants.APEX_SYNC_EVERY == 0:
+                        self.broadcast_weights()
+        finally:
+            self.shutdown()
+        elapsed = time.perf_counter() - start
+        print(f"Frames: {self.total_frames} ; Gradient Steps: {self.agent.gradient_steps} ; Time: {elapsed:.1f}s ; Frames/sec: {self.total_frames / elapsed:.0f}")
+        if constants.SAVE_MODEL and self.agent.top_score > constants.SAVE_IF_SCORE:
+            self.save_as_model()
+
+    def shutdown(self) -> None:
+        """Stop Actors ; Queues are Drained so Blocked Puts can Return"""
+        self.stop.set()
+        while any(actor.is_alive() for actor in self.actors):
+            for q in (self.transitions, self.scores):
+                try:
+                    while True:
+                        q.get_nowait()
+                except (queue.Empty, OSError):    # OSError: Chunk's Actor Already Exited
+                    pass
+            for actor in self.actors:
+                actor.join(timeout=0.05)
+
+    def save_as_model(self) -> None:
+        """Save the Snapshot of the Used Model ; Same Layout as main.FlappyBird.save_as_model"""
+        path = f"{self.assets_path}/models/Model{time.strftime('%Y%b%d-%H:%M:%S')}"
+        os.makedirs(path)
+        for file in constants.SAVE_FILES:
+            shutil.copyfile(f"{os.path.dirname(os.path.abspath(__file__))}/{file}.py", f"{path}/{file}.py")
+        self.agent.save_model(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ape-X Style Flappy Bird Training")
+    parser.add_argument("--actors", type=int, default=constants.APEX_NUM_ACTORS, help="Number of actor processes")
+    parser.add_argument("--games", type=int, default=constants.TRAIN_X_ITER, help="Number of games to train for")
+    args = parser.parse_args()
+
+    ApeX(num_actors=args.actors).train(args.games)
@@ -0,0 +1,157 @@
+import argparse, contextlib, json, os, platform, subprocess, sys, time
+import numpy as np
+import torch
+import constants
+from agent import QLearningAgent
+from core.game import Environment as Env
+from core.vector import VectorEnvironment
+
+
+@contextlib.contextmanager
+def override(**values):
+    """Temporarily Change constants ; Only for Building Benchmark Objects"""
+    previous = {name: getattr(constants, name) for name in values}
+    for name, value in values.items():
+        setattr(constants, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(constants, name, value)
+
+
+def rate(fn, min_time:float) -> float:
+    """Calls of fn per Second, Repeated for at Least min_time Seconds after a Warm-Up Call"""
+    fn()
+    calls, start = 0, time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < min_time:
+        fn()
+        calls += 1
+    return calls / elapsed
+
+
+def make_agent(memory_size:int=constants.MEMORY_SIZE) -> QLearningAgent:
+    return QLearningAgent(constants.INPUT, constants.OUTPUT, assets_path="", memory_size=memory_size)
+
+
+def fill_memory(agent:QLearningAgent, rng:np.random.Generator) -> None:
+    """Random Transitions up to Capacity"""
+    n = agent.memory.capacity
+    states = rng.normal(size=(n, constants.INPUT)).astype(np.float32)
+    agent.memory.add_batch(states, rng.integers(0, constants.OUTPUT, n), rng.normal(size=n), states, rng.random(n) < 0.01)
+
+
+def bench_env(min_time:float, rng:np.random.Generator) -> dict:
+    """Scalar Environment & VectorEnvironment Frames per Second with Random Actions"""
+    results = {}
+    actions = (rng.random(4096) < 0.08).astype(int)
+    state = {"game": Env(seed=0), "t": 0}
+    def scalar_step():
+        game = state["game"]
+        game.create_pipe()
+        action = actions[state["t"] % len(actions)]
+        if action == 1:
+            game.bird.flap()
+        game.update_variables()
+        game.detect_collision()
+        game.reward(action)
+        game.pipe_cleared()
+        state["t"] += 1
+        if not game.run:
+            state["game"] = Env(seed=state["t"])
+    results["env_scalar_steps_per_sec"] = rate(scalar_step, min_time)
+
+    for num_envs in (64, 1024):
+        venv = VectorEnvironment(num_envs, seed=0)
+        vector_actions = (rng.random((16, num_envs)) < 0.08).astype(np.int64)
+        counter = {"t": 0}
+        def vector_step():
+            venv.step(vector_actions[counter["t"] % 16])
+            counter["t"] += 1
+        results[f"env_vector{num_envs}_steps_per_sec"] = rate(vector_step, min_time) * num_envs
+    return results
+
+
+def bench_act(min_time:float, rng:np.random.Generator) -> dict:
+    """Latency of a Greedy act() & Throughput of act_batch()"""
+    agent = make_agent()
+    agent.epsilon = 0.0
+    state = rng.normal(size=constants.INPUT).astype(np.float32)
+    results = {"act_latency_us": 1e6 / rate(lambda: agent.act(state), min_time)}
+    states = rng.normal(size=(256, constants.INPUT)).astype(np.float32)
+    results["act_batch256_states_per_sec"] = rate(lambda: agent.act_batch(states), min_time) * len(states)
+    return results
+
+
+def bench_replay(min_time:float, rng:np.random.Generator, batch_sizes:list[int], hidden_sizes:list[int]) -> dict:
+    """replay() Batches per Second for Each BATCH_SIZE x HL_NODES Pair"""
+    results = {}
+    for hidden in hidden_sizes:
+        with override(HL_NODES=hidden):
+            agent = make_agent(memory_size=max(batch_sizes) * 32)
+        fill_memory(agent, rng)
+        for batch_size in batch_sizes:
+            results[f"replay_b{batch_size}_h{hidden}_batches_per_sec"] = rate(lambda: agent.replay(batch_size), min_time)
+    return results
+
+
+def bench_train(num_games:int) -> dict:
+    """End-to-End Frames per Second of Headless Training (train.Trainer)"""
+    from train import Trainer
+    with open(os.devnull, "w") as sink, override(SAVE_MODEL=False, LOAD_MODEL=False, METRICS_LOG=False), contextlib.redirect_stdout(sink):
+        trainer = Trainer()
+        trainer.train(trainer.agent.num_games + num_games)
+    return {"train_frames_per_sec": trainer.total_frames / trainer.train_time}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)), text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(results:dict, baseline_path:str) -> None:
+    """Print Ratio of Each Metric to a Previous Run ; > 1 is Faster (Lower is Better for Latencies)"""
+    with open(baseline_path) as file:
+        baseline = json.load(file)["results"]
+    for name, value in results.items():
+        if name in baseline:
+            print(f"{name:45s} {baseline[name]:14.1f} -> {value:14.1f}  x{value / baseline[name]:.2f}", file=sys.stderr)
+
+
+def run(min_time:float=1.0, train_games:int=20, seed:int=0) -> dict:
+    torch.set_num_threads(1)
+    torch.manual_seed(seed)
+    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
+
+    results = {}
+    results.update(bench_env(min_time, rng))
+    results.update(bench_act(min_time, rng))
+    results.update(bench_replay(min_time, rng, batch_sizes=[32, 128, 512], hidden_sizes=[64, 128]))
+    results.update(bench_train(train_games))
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": {"platform": platform.platform(), "processor": platform.processor(), "cpus": os.cpu_count(), "python": platform.python_version(), "torch": torch.__version__, "numpy": np.__version__},
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flappy Bird Throughput Benchmarks (CPU)")
+    parser.add_argument("--output", help="Write results as JSON to this file (default: stdout)")
+    parser.add_argument("--compare", help="Previous JSON results to compare against")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds spent on each measurement")
+    parser.add_argument("--train-games", type=int, default=20, help="Games played by the end-to-end benchmark")
+    args = parser.parse_args()
+
+    report = run(args.min_time, args.train_games)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        compare(report["results"], args.compare)
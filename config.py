@@ -0,0 +1,13 @@
+import constants
+from types import SimpleNamespace
+
+class Config(SimpleNamespace):
+    """Copy of Every UPPER_CASE Value in constants.py with Overrides ; Passed Where the constants Module is Expected
+    Derived Values (FLAP_CONST, PIPE_MIN_MAX_OFFSET, ...) are Not Recomputed, Override them Explicitly"""
+    @classmethod
+    def from_constants(cls, **overrides) -> "Config":
+        values = {name: getattr(constants, name) for name in dir(constants) if name.isupper()}
+        unknown = set(overrides) - set(values)
+        if unknown:
+            raise KeyError(f"Unknown constants: {', '.join(sorted(unknown))}")
+        return cls(**(values | overrides))
@@ -25,6 +25,7 @@ HL_NODES = 64
 BATCH_SIZE = 32
 INPUT, OUTPUT = 2, 2
 AGENT_GAMMA = 0.9
+N_STEP = 1                              # Rewards Summed per Stored Transition ; Bootstraps from gamma^N * Q(s_{t+N})
 AGENT_EPSILON = 0.25
 AGENT_EPSILON_MIN = 0.00001
 AGENT_EPSILON_EXP_DECAY = 0.9
@@ -35,15 +36,50 @@ AGENT_INIT_LEARNING_RATE = 0.01
 AGENT_MIN_LEARNING_RATE = 0.005
 AGENT_LEARNING_RATE_ITERATIONS = 100
 SAVE_IF_SCORE = 0
-SAVE_INTERVAL = 500
+SAVE_INTERVAL = 500                     # Games Between Background Checkpoints
+CHECKPOINT_FOLDER = "Checkpoint"        # Periodic Checkpoints go to assets/models/CHECKPOINT_FOLDER
 MEMORY_SIZE = 1000
-SAVE_FILES = ["agent", "constants", "main"]
-UPDATE_MODEL_DICT_EVERY = 1
+SEED = None                             # int: Reproducible Games, Weights, Exploration & Replay Sampling ; None: Fresh Randomness
+PRIORITIZED_REPLAY = False              # Sample Transitions Proportionally to their TD Error (Sum Tree)
+PER_ALPHA = 0.6                         # 0: Uniform, 1: Fully Proportional
+PER_BETA = 0.4                          # Importance-Sampling Correction, Annealed to 1
+PER_BETA_INCREMENT = 0.0001             # Beta Added per Sampled Batch
+PER_EPSILON = 0.00001                   # Keeps Zero TD Error Transitions Reachable
+SAVE_FILES = ["agent", "constants", "main", "memory"]
+TARGET_UPDATE_EVERY = 500               # Gradient Steps Between Hard Target Network Syncs
+TARGET_TAU = 0.0                        # > 0: Polyak Average the Target Every Gradient Step Instead
+INFERENCE_BACKEND = "auto"              # act() Forward ; "eager", "script", "compile", "numpy" or "auto" (Fastest Candidate at Startup)
+INFERENCE_CANDIDATES = ("numpy", "script", "eager")    # Timed by "auto" ; "compile" Also Works but Takes Seconds to Warm Up
+# Policy Server ; serve.py Answers Many Local Game Clients with One Forward Pass per Micro-Batch
+SERVE_SOCKET = "/tmp/flappy_policy.sock"
+SERVE_MAX_BATCH = 256                   # States per Forward Pass
+SERVE_MAX_LATENCY_MS = 2.0              # Longest a Request Waits for its Batch to Fill
+SERVE_REPORT_EVERY = 10                 # Seconds Between Latency & Batch Size Reports
+# Update Schedule ; Trade Sample Efficiency for Frames per Second
+TRAIN_EVERY = 1                         # Learn Every K Env Steps
+GRADIENT_STEPS = 1                      # G Gradient Steps per Learning Update
+LEARNING_STARTS = 0                     # Wait for M Transitions in Memory Before Learning
+ACTION_REPEAT = 1                       # Frames an Action is Held per Decision (train.py & apex.py) ; One Transition per Decision
+
+# Ape-X ; Actor Processes Feed a Single Learner (apex.py)
+APEX_NUM_ACTORS = 4
+APEX_SEND_EVERY = 64                    # Transitions per Chunk Sent to the Learner
+APEX_SYNC_EVERY = 400                   # Gradient Steps Between Weight Broadcasts
+APEX_EPSILON = 0.4                      # Actor i Explores with APEX_EPSILON ** (1 + i / (N - 1) * APEX_EPSILON_ALPHA)
+APEX_EPSILON_ALPHA = 7
+
+# Pixel Observations ; pixels.py Trains a ConvQNetwork on Stacked Grayscale Frames (core/render.py)
+PIXEL_HEIGHT = 64
+PIXEL_WIDTH = 48
+FRAME_STACK = 4                         # Consecutive Frames per Observation, so Velocity is Visible
+PIXEL_ENVS = 16                         # Games Stepped & Rendered Together
 
 
 ## Model Iterations
 STOP_NEW_LEARNING_AFTER_SCORE = 70
 TRAIN_X_ITER = 500
+EVAL_EPISODES = 1000                    # Seeded Games Played by evaluate.py
+EVAL_MAX_FRAMES = 20000                 # Evaluation Episodes are Cut Here so Near-Perfect Policies End
 
 
 ## Enables/Disables
@@ -56,4 +92,21 @@ LOAD_MODEL = False
 SAVE_MODEL = True
 MODEL_NAME = {"folder": "Model2024Nov27-10:19:40", "file": "flappy_model"}  # Load models from models folder
 # PyGame
-SHOW_GAME = False
\ No newline at end of file
+SHOW_GAME = False
+SPECTATE = False                        # Draw in a Separate Process from Snapshots (managers/Spectator.py) ; Training Runs Uncapped while Shown
+# Logging
+PRINT_SCORES = True                     # Terminal Line After Each Game
+METRICS_LOG = True                      # Per-Game .npy Chunks in assets/metrics (utils/Metrics.py)
+METRICS_CHUNK_SIZE = 256                # Games Buffered per Disk Write
+RECORD_TOP_EPISODES = 5                 # Best Games of a Run Kept as Seed + Bit-Packed Actions in assets/episodes (replay.py) ; 0: Off
+# Plotting ; Rendered by a Separate Process (utils/AsyncPlotting.py)
+PLOT_INTERACTIVE = True                 # False: No Window, Graph only Written by save_graph
+PLOT_MAX_HZ = 2                         # Max Redraws per Second
+PLOT_MAX_POINTS = 2000                  # Older Games are Averaged Together Beyond This
+# Profiling ; Per-Stage Timing of the Training Loop (utils/Profiling.py)
+PROFILE = False
+PROFILE_WINDOW = 20                     # Games in the Rolling Breakdown
+PROFILE_TRACE = None                    # None, "cprofile" or "torch"
+PROFILE_TRACE_START = 10                # First Game Traced
+PROFILE_TRACE_GAMES = 5                 # Number of Games Traced
+PROFILE_TRACE_FILE = "profile_trace"    # Written as .prof (cprofile) or .json (torch)
\ No newline at end of file
@@ -0,0 +1,133 @@
+import copy, heapq, os, constants
+import numpy as np
+from core.game import Environment, ActionRepeat
+
+# Episode Recording ; Everything Else is Re-Simulated from the Seed
+# seed | repeat (Frames per Decision) | decisions | frames | score | actions (1 Bit per Decision, Little-Endian Bit Order)
+
+
+class EpisodeRecorder:
+    """Actions of One Seeded Game ; Passed to ActionRepeat, which Records Every Decision"""
+    __slots__ = ("seed", "repeat", "actions", "decisions")
+
+    def __init__(self, seed:int, repeat:int=1, capacity:int=4096):
+        self.seed:int = seed
+        self.repeat:int = repeat
+        self.actions:np.ndarray = np.zeros(capacity, dtype=np.uint8)     # One Byte per Decision until finish Packs Them
+        self.decisions:int = 0
+
+    def record(self, action:int) -> None:
+        """Append a Decision ; Doubles the Buffer when Full"""
+        if self.decisions == len(self.actions):
+            self.actions = np.concatenate((self.actions, np.zeros_like(self.actions)))
+        self.actions[self.decisions] = action
+        self.decisions += 1
+
+    def finish(self, game:Environment) -> dict[str, np.ndarray]:
+        """The Finished Game as a Recording"""
+        return {
+            "seed": np.int64(self.seed), "repeat": np.int64(self.repeat), "decisions": np.int64(self.decisions),
+            "frames": np.int64(game.frames), "score": np.int64(game.score),
+            "actions": np.packbits(self.actions[:self.decisions], bitorder="little"),
+        }
+
+
+def save(path:str, recording:dict[str, np.ndarray]) -> None:
+    np.savez_compressed(path, **recording)
+
+
+def load(path:str) -> dict[str, np.ndarray]:
+    with np.load(path) as file:
+        return dict(file)
+
+
+def unpack_actions(recording:dict[str, np.ndarray]) -> np.ndarray:
+    return np.unpackbits(recording["actions"], count=int(recording["decisions"]), bitorder="little")
+
+
+class EpisodeArchive:
+    """Top k Recordings of a Run by Score, Kept as .npz Files in folder ; Lower Scores are Deleted as Better Games Arrive"""
+    def __init__(self, folder:str, k:int):
+        self.folder:str = folder
+        self.k:int = k
+        self.kept:list[tuple[int, int, str]] = []   # Min-Heap of (Score, Game, Path)
+        os.makedirs(folder, exist_ok=True)
+
+    def qualifies(self, score:int) -> bool:
+        """Would a Game with score be Kept ; Lets Callers Skip Packing Most Games"""
+        return len(self.kept) < self.k or score > self.kept[0][0]
+
+    def add(self, game_number:int, recording:dict[str, np.ndarray]) -> bool:
+        """Keep recording if it is Among the Best k so Far"""
+        score = int(recording["score"])
+        if not self.qualifies(score):
+            return False
+        path = f"{self.folder}/Game{game_number}_Score{score}.npz"
+        save(path, recording)
+        if len(self.kept) < self.k:
+            heapq.heappush(self.kept, (score, game_number, path))
+        else:
+            _, _, evicted = heapq.heappushpop(self.kept, (score, game_number, path))
+            if os.path.exists(evicted):
+                os.remove(evicted)
+        return True
+
+
+class Replayer:
+    """Deterministic Re-Simulation of a Recording ; Keyframes Every keyframe_every Decisions Make Seeking Cheap"""
+    def __init__(self, recording:dict[str, np.ndarray], keyframe_every:int=500, config=constants):
+        self.config = config
+        self.recording:dict[str, np.ndarray] = recording
+        self.actions:np.ndarray = unpack_actions(recording)
+        self.keyframe_every:int = keyframe_every
+        self.keyframes:list[ActionRepeat] = []
+        # One Headless Pass ; Stores Keyframes & Checks the Recording Replays to the Same End
+        env = self.start()
+        for decision, action in enumerate(self.actions):
+            if decision % keyframe_every == 0:
+                self.keyframes.append(self.copy(env))
+            if not env.game.run:
+                raise ValueError(f"Game Ended at Decision {decision} of {len(self.actions)} ; Recording does not Match this Engine")
+            env.step(int(action))
+        game = env.game
+        if game.run or game.score != recording["score"] or game.frames != recording["frames"]:
+            raise ValueError(
+                f"Replay Ended with Score {game.score} after {game.frames} Frames (Running: {game.run}) ; " +
+                f"Recorded Score {recording['score']} after {recording['frames']} Frames"
+            )
+        self.env:ActionRepeat = None
+        self.decision:int = 0
+        self.reward:float = 0.0
+        self.seek(0)
+
+    def start(self) -> ActionRepeat:
+        return ActionRepeat(Environment(seed=int(self.recording["seed"]), config=self.config), int(self.recording["repeat"]))
+
+    def copy(self, env:ActionRepeat) -> ActionRepeat:
+        """Deep Copy Sharing the config Module"""
+        return copy.deepcopy(env, {id(self.config): self.config})
+
+    @property
+    def game(self) -> Environment:
+        return self.env.game
+
+    @property
+    def done(self) -> bool:
+        return self.decision >= len(self.actions)
+
+    def step(self) -> float:
+        """Play the Next Recorded Decision"""
+        if not self.done:
+            self.reward = self.env.step(int(self.actions[self.decision]))
+            self.decision += 1
+        return self.reward
+
+    def seek(self, decision:int) -> None:
+        """Jump to Just Before decision ; From the Nearest Earlier Keyframe"""
+        decision = max(0, min(decision, len(self.actions)))
+        keyframe = min(decision // self.keyframe_every, len(self.keyframes) - 1)
+        self.env = self.copy(self.keyframes[keyframe])
+        self.decision = keyframe * self.keyframe_every
+        self.reward = 0.0
+        while self.decision < decision:
+            self.step()
@@ -1,15 +1,19 @@
 import constants
-from random import randint
+from collections import deque
+from random import Random, randint
 
 class Bird:
-    def __init__(self):
-        self.x = constants.BIRD_INIT["X"]
-        self.y = constants.BIRD_INIT["Y"]
+    __slots__ = ("x", "y", "velocity", "flap_const")
+
+    def __init__(self, config=constants):
+        self.x = config.BIRD_INIT["X"]
+        self.y = config.BIRD_INIT["Y"]
         self.velocity:float = 0.0
+        self.flap_const:float = config.FLAP_CONST
 
     def flap(self) -> None:
         """Increases Bird's Velocity"""
-        self.velocity -= constants.FLAP_CONST
+        self.velocity -= self.flap_const
 
     def update(self, gravity:float) -> None:
         """Update Velocity"""
@@ -17,43 +21,70 @@ class Bird:
         self.y += int(self.velocity)
 
 class Pipe:
-    def __init__(self):
-        self.x:int = constants.WINDOW_WIDTH + 50
-        self.y:int = randint(constants.PIPE_MIN_MAX_OFFSET, constants.WINDOW_HEIGHT - constants.PIPE_MIN_MAX_OFFSET)
-        self.gap:int = constants.PIPE_GAP
+    __slots__ = ("x", "y", "gap", "cleared", "speed", "exit_x")
+
+    def __init__(self, rng:Random=None, config=constants):
+        self.x:int = config.WINDOW_WIDTH + 50
+        self.y:int = (rng.randint if rng else randint)(config.PIPE_MIN_MAX_OFFSET, config.WINDOW_HEIGHT - config.PIPE_MIN_MAX_OFFSET)
+        self.gap:int = config.PIPE_GAP
         self.cleared:bool = False
+        self.speed:int = config.GAME_X_SPEED
+        self.exit_x:int = -config.PIPE_SIZE["X"]
 
     def update(self) -> bool:
         """Update Pipe's X"""
-        self.x -= constants.GAME_X_SPEED
-        return self.x > -constants.PIPE_SIZE["X"]
+        self.x -= self.speed
+        return self.x > self.exit_x
 
 class Environment:
-    def __init__(self):
+    __slots__ = (
+        "config", "rng", "run", "gravity", "score", "frames", "bird", "pipes", "ceil", "floor",
+        "max_vel", "pipe_every", "pipe_width", "pipe_gap", "bird_right", "bird_height", "bird_half_height",
+        "bird_max_y", "zone_shift", "zone_half_width",
+    )
+
+    def __init__(self, seed:int=None, config=constants):
+        self.config             = config
+        self.rng:Random         = Random(seed)
         self.run:bool           = True
-        self.gravity:float      = constants.GRAVITY
+        self.gravity:float      = config.GRAVITY
         self.score:int          = 0
         self.frames:int         = 0
-        self.bird:Bird          = Bird()
-        self.pipes:list[Pipe]   = list()
+        self.bird:Bird          = Bird(config)
         self.ceil:int           = 0
-        self.floor:int          = constants.WINDOW_HEIGHT
+        self.floor:int          = config.WINDOW_HEIGHT
+        # Geometry & Reward Thresholds ; Read Once per Game instead of through config Every Frame
+        self.max_vel:float          = config.MAX_VEL
+        self.pipe_every:int         = config.WINDOW_WIDTH // config.GAME_X_SPEED if config.WINDOW_WIDTH < 500 else 100
+        self.pipe_width:int         = config.PIPE_SIZE["X"]
+        self.pipe_gap:int           = config.PIPE_GAP
+        self.bird_right:int         = self.bird.x + config.BIRD_SIZE["X"]
+        self.bird_height:int        = config.BIRD_SIZE["Y"]
+        self.bird_half_height:int   = config.BIRD_SIZE["Y"] // 2
+        self.bird_max_y:int         = self.floor - config.BIRD_SIZE["Y"]
+        self.zone_shift:float       = config.PIPE_GAP * config.SHIFT_DOWN
+        self.zone_half_width:float  = config.PIPE_GAP * config.CENTER_FOCUS
+        # Pipes ; Oldest First, Bounded by How Many Fit on Screen at Once
+        pipe_lifespan:int       = (config.WINDOW_WIDTH + 50 + self.pipe_width) // config.GAME_X_SPEED + 1
+        self.pipes:deque[Pipe]  = deque(maxlen=pipe_lifespan // self.pipe_every + 1)
 
     def update_variables(self) -> None:
         """Update variables for next frame"""
-        self.pipes = [pipe for pipe in self.pipes if pipe.update()]
-        self.bird.velocity = max(-constants.MAX_VEL, min(constants.MAX_VEL, self.bird.velocity))
-        self.bird.update(self.gravity)
+        pipes = self.pipes
+        for pipe in pipes:
+            pipe.x -= pipe.speed
+        # Pipes Scroll in Spawn Order, so Only the Oldest can Leave the Screen
+        while pipes and pipes[0].x <= pipes[0].exit_x:
+            pipes.popleft()
+        bird = self.bird
+        bird.velocity = max(-self.max_vel, min(self.max_vel, bird.velocity))
+        bird.update(self.gravity)
         self.frames += 1
 
     def create_pipe(self):
         """Create New Pipes"""
-        if constants.WINDOW_WIDTH < 500:
-            if self.frames % (constants.WINDOW_WIDTH // constants.GAME_X_SPEED) == 0:
-                self.pipes.append(Pipe())
-        else:
-            if self.frames % 100 == 0:
-                self.pipes.append(Pipe())
+        if self.frames % self.pipe_every == 0:
+            self.pipes.append(Pipe(self.rng, self.config))
 
     def pipe_cleared(self):
         """Verifies if pipe passed for first time"""
@@ -65,31 +96,72 @@ class Environment:
 
     def detect_collision(self) -> None:
         """True: Continue - False: Stop"""
+        bird_y = self.bird.y
         # Check for floor collisions
-        if self.bird.y <= self.ceil or self.bird.y >= self.floor - constants.BIRD_SIZE["Y"]:
+        if bird_y <= self.ceil or bird_y >= self.bird_max_y:
             self.run = False
             return
         # Check for pipe collisions
+        bird_x, bird_right, bird_bottom, gap = self.bird.x, self.bird_right, bird_y + self.bird_height, self.pipe_gap
         for pipe in self.pipes:
-            if (self.bird.x + constants.BIRD_SIZE["X"] > pipe.x and self.bird.x < pipe.x + constants.PIPE_SIZE["X"]):
-                if (self.bird.y < pipe.y - constants.PIPE_GAP or self.bird.y + constants.BIRD_SIZE["Y"] > pipe.y + constants.PIPE_GAP):
+            if bird_right > pipe.x and bird_x < pipe.x + self.pipe_width:
+                if bird_y < pipe.y - gap or bird_bottom > pipe.y + gap:
                     self.run = False
                     return
         self.run = True
-    
+
+    def get_state(self) -> tuple[float, float]:
+        """Features the Agent Sees ; Bird's Center Relative to First Pipe & Bird's Y Velocity"""
+        return (
+            float((self.bird.y + self.bird_half_height) - self.pipes[0].y),
+            float(self.bird.velocity),
+        )
+
     def reward(self, action:int) -> float:
         """Rewarding System"""
         reward = 0.5 # Surviving
         if self.run:
+            bird_y, pipe_y = self.bird.y, self.pipes[0].y
             # In Increased Reward Zone ; Green Zone when Visuals.display_score_zones() is turned on
-            if abs((self.pipes[0].y + constants.PIPE_GAP * constants.SHIFT_DOWN) - (self.bird.y + constants.BIRD_SIZE["Y"]//2)) < constants.PIPE_GAP * constants.CENTER_FOCUS:
+            if abs((pipe_y + self.zone_shift) - (bird_y + self.bird_half_height)) < self.zone_half_width:
                 reward = 20 + 0.01 * self.score
             # If the Bird is higher than pipes and flaps, moves towards death, therefore big reward deduction
-            if self.bird.y + constants.BIRD_SIZE["Y"] < self.pipes[0].y - constants.PIPE_GAP and action == 1:
+            if bird_y + self.bird_height < pipe_y - self.pipe_gap and action == 1:
                 reward -= 20
             # If the Bird is lower than pipes and doesn't flaps, moves towards death, therefore big reward deduction
-            if self.bird.y  > self.pipes[0].y + constants.PIPE_GAP and action == 0:
+            if bird_y > pipe_y + self.pipe_gap and action == 0:
                 reward -= 20
         else:
             reward = -100 # Collision
-        return reward
\ No newline at end of file
+        return reward
+
+
+class ActionRepeat:
+    """Environment Driven One Decision per repeat Frames ; Same Physics, One Transition per Decision
+    A recorder (core.episodes.EpisodeRecorder) Gets Every Decision, so the Game can be Replayed from its Seed"""
+    __slots__ = ("game", "repeat", "recorder")
+
+    def __init__(self, game:Environment, repeat:int=1, recorder=None):
+        self.game:Environment = game
+        self.repeat:int = repeat
+        self.recorder = recorder
+        game.create_pipe()
+
+    def step(self, action:int) -> float:
+        """Apply action for up to repeat Frames ; Rewards are Summed & a Collision Ends the Step Early"""
+        game = self.game
+        if self.recorder is not None:
+            self.recorder.record(action)
+        reward = 0.0
+        for _ in range(self.repeat):
+            if action == 1:
+                game.bird.flap()
+            game.update_variables()
+            game.detect_collision()
+            reward += game.reward(action)
+            game.pipe_cleared()
+            if not game.run:
+                break
+            # Next Frame's Pipe ; Appended Behind pipes[0], so get_state is Unaffected
+            game.create_pipe()
+        return reward
@@ -0,0 +1,95 @@
+import numpy as np
+from core.vector import VectorEnvironment
+
+class PixelRenderer:
+    """Offscreen Grayscale Frames of Every Game in a VectorEnvironment ; No Display, No Per-Frame Surfaces
+    Bird & Pipes are Axis-Aligned Rectangles, Rasterized at Pixel Centers into Preallocated uint8 Buffers"""
+    BACKGROUND, PIPE, BIRD = 0, 128, 255
+
+    def __init__(self, venv:VectorEnvironment, height:int, width:int, stack:int):
+        config = venv.config
+        self.venv:VectorEnvironment = venv
+        self.stack:int = stack
+        n, k = venv.num_envs, venv.max_pipes
+        # World Coordinates of Each Pixel's Center
+        self.row_y:np.ndarray = (np.arange(height) + 0.5) * (config.WINDOW_HEIGHT / height)
+        self.col_x:np.ndarray = (np.arange(width) + 0.5) * (config.WINDOW_WIDTH / width)
+        self.pipe_gap:int = config.PIPE_GAP
+        self.pipe_width:int = config.PIPE_SIZE["X"]
+        self.bird_height:int = config.BIRD_SIZE["Y"]
+        # The Bird Never Moves Sideways ; its Columns are Fixed
+        self.bird_cols:np.ndarray = (self.col_x >= venv.bird_x) & (self.col_x < venv.bird_x + config.BIRD_SIZE["X"])
+
+        ## Frame Stack ; Ring of stack Frames per Game, head is the Newest
+        self.frames:np.ndarray = np.zeros((n, stack, height, width), dtype=np.uint8)
+        self.head:int = stack - 1
+        # Two Output Buffers, so a Returned Observation Survives the Next Call (state & next_state)
+        self.outputs:list[np.ndarray] = [np.zeros((n, stack, height, width), dtype=np.uint8) for _ in range(2)]
+        self.output:int = 0
+        ## Scratch
+        self.rows:np.ndarray = np.zeros((n, k, height), dtype=bool)
+        self.rows_below:np.ndarray = np.zeros((n, k, height), dtype=bool)
+        self.cols:np.ndarray = np.zeros((n, k, width), dtype=bool)
+        self.cols_right:np.ndarray = np.zeros((n, k, width), dtype=bool)
+        self.bird_rows:np.ndarray = np.zeros((n, height), dtype=bool)
+        self.mask:np.ndarray = np.zeros((n, height, width), dtype=bool)
+        self.pipe_mask:np.ndarray = np.zeros((n, height, width), dtype=bool)
+
+        self.render()
+        self.reset(np.ones(n, dtype=bool))
+
+    @property
+    def frame_shape(self) -> tuple[int, int, int]:
+        return self.frames.shape[1:]
+
+    def draw(self, frame:np.ndarray) -> None:
+        """Rasterize the Current Games into frame (N, Height, Width)"""
+        venv = self.venv
+        # Pipes ; Columns Inside [x, x + width), Rows Outside the Gap [y - gap, y + gap]
+        pipe_x, pipe_y = venv.pipe_x[:, :, None], venv.pipe_y[:, :, None]
+        np.greater_equal(self.col_x, pipe_x, out=self.cols)
+        np.less(self.col_x, pipe_x + self.pipe_width, out=self.cols_right)
+        self.cols &= self.cols_right
+        self.cols &= venv.pipe_alive[:, :, None]
+        np.less(self.row_y, pipe_y - self.pipe_gap, out=self.rows)
+        np.greater(self.row_y, pipe_y + self.pipe_gap, out=self.rows_below)
+        self.rows |= self.rows_below
+        self.pipe_mask[:] = False
+        for slot in range(self.rows.shape[1]):
+            np.logical_and(self.rows[:, slot, :, None], self.cols[:, slot, None, :], out=self.mask)
+            self.pipe_mask |= self.mask
+        # Bird ; Rows Inside [y, y + height)
+        bird_y = venv.bird_y[:, None]
+        np.greater_equal(self.row_y, bird_y, out=self.bird_rows)
+        self.bird_rows &= self.row_y < bird_y + self.bird_height
+        np.logical_and(self.bird_rows[:, :, None], self.bird_cols, out=self.mask)
+
+        frame[:] = self.BACKGROUND
+        frame[self.pipe_mask] = self.PIPE
+        frame[self.mask] = self.BIRD
+
+    def render(self) -> None:
+        """Push the Current Frame of Every Game onto its Stack"""
+        self.head = (self.head + 1) % self.stack
+        self.draw(self.frames[:, self.head])
+
+    def reset(self, mask:np.ndarray) -> None:
+        """Fill the Masked Games' Stacks with their Newest Frame ; Call after render when Games Restarted"""
+        if mask.any():
+            self.frames[mask] = self.frames[mask, self.head][:, None]
+
+    def observation(self) -> np.ndarray:
+        """Stacks Oldest to Newest, Flattened to (N, Stack * Height * Width) uint8
+        Valid until the Call after Next ; Copy to Keep Longer"""
+        self.output ^= 1
+        order = (self.head + 1 + np.arange(self.stack)) % self.stack
+        out = self.outputs[self.output]
+        np.take(self.frames, order, axis=1, out=out)
+        return out.reshape(len(out), -1)
+
+    def step(self, actions:np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """VectorEnvironment.step with Pixel Observations ; Finished Games' next_states Show their New Episode"""
+        _, rewards, dones, scores = self.venv.step(actions)
+        self.render()
+        self.reset(dones)
+        return self.observation(), rewards, dones, scores
@@ -0,0 +1,146 @@
+import constants
+import numpy as np
+from random import Random, randrange
+
+class VectorEnvironment:
+    """N Flappy Bird Games Stepped at Once ; Struct-of-Arrays Mirror of core.game.Environment"""
+    def __init__(self, num_envs:int, seed:int=None, config=constants):
+        self.config             = config
+        self.num_envs:int       = num_envs
+        self.seed:int           = randrange(2**31) if seed is None else seed
+        self.gravity:float      = self.config.GRAVITY
+        self.ceil:int           = 0
+        self.floor:int          = self.config.WINDOW_HEIGHT
+        # Pipe Spawning ; Same Rule as Environment.create_pipe
+        self.pipe_every:int     = self.config.WINDOW_WIDTH // self.config.GAME_X_SPEED if self.config.WINDOW_WIDTH < 500 else 100
+        pipe_lifespan:int       = (self.config.WINDOW_WIDTH + 50 + self.config.PIPE_SIZE["X"]) // self.config.GAME_X_SPEED + 1
+        self.max_pipes:int      = pipe_lifespan // self.pipe_every + 1
+        self.envs:np.ndarray    = np.arange(num_envs)
+
+        # Bird
+        self.bird_x:int                 = self.config.BIRD_INIT["X"]
+        self.bird_y:np.ndarray          = np.empty(num_envs, dtype=np.float64)
+        self.bird_velocity:np.ndarray   = np.empty(num_envs, dtype=np.float64)
+        # Pipes ; Ring of max_pipes Slots per Game, pipe_head Points to the Oldest (Environment.pipes[0])
+        self.pipe_x:np.ndarray          = np.zeros((num_envs, self.max_pipes), dtype=np.int64)
+        self.pipe_y:np.ndarray          = np.zeros((num_envs, self.max_pipes), dtype=np.int64)
+        self.pipe_cleared:np.ndarray    = np.zeros((num_envs, self.max_pipes), dtype=bool)
+        self.pipe_alive:np.ndarray      = np.zeros((num_envs, self.max_pipes), dtype=bool)
+        self.pipe_head:np.ndarray       = np.zeros(num_envs, dtype=np.int64)
+        self.pipe_count:np.ndarray      = np.zeros(num_envs, dtype=np.int64)
+        # Game
+        self.run:np.ndarray             = np.ones(num_envs, dtype=bool)
+        self.score:np.ndarray           = np.zeros(num_envs, dtype=np.int64)
+        self.frames:np.ndarray          = np.zeros(num_envs, dtype=np.int64)
+        self.episodes:np.ndarray        = np.zeros(num_envs, dtype=np.int64)
+        self.rngs:list[Random]          = [None] * num_envs
+
+        self.reset(np.ones(num_envs, dtype=bool))
+
+    def episode_seed(self, env:int) -> int:
+        """Seed of env's Current Episode ; Environment(seed=...) Plays the Same Game"""
+        return self.seed + int(env) + int(self.episodes[env]) * self.num_envs
+
+    def reset(self, mask:np.ndarray) -> None:
+        """Restart Masked Games with Fresh Birds, No Pipes and their Next Episode Seed"""
+        self.bird_y[mask] = self.config.BIRD_INIT["Y"]
+        self.bird_velocity[mask] = 0.0
+        self.pipe_alive[mask] = False
+        self.pipe_cleared[mask] = False
+        self.pipe_head[mask] = 0
+        self.pipe_count[mask] = 0
+        self.run[mask] = True
+        self.score[mask] = 0
+        self.frames[mask] = 0
+        for env in np.flatnonzero(mask):
+            self.rngs[env] = Random(self.episode_seed(env))
+        self.create_pipe(mask)
+
+    def create_pipe(self, mask:np.ndarray=None) -> None:
+        """Create New Pipes in Games Reaching the Spawn Frame ; Only Masked Games if mask is Given"""
+        spawn = self.frames % self.pipe_every == 0
+        if mask is not None:
+            spawn &= mask
+        for env in np.flatnonzero(spawn):
+            slot = (self.pipe_head[env] + self.pipe_count[env]) % self.max_pipes
+            self.pipe_x[env, slot] = self.config.WINDOW_WIDTH + 50
+            self.pipe_y[env, slot] = self.rngs[env].randint(self.config.PIPE_MIN_MAX_OFFSET, self.config.WINDOW_HEIGHT - self.config.PIPE_MIN_MAX_OFFSET)
+            self.pipe_cleared[env, slot] = False
+            self.pipe_alive[env, slot] = True
+            self.pipe_count[env] += 1
+
+    def first_pipe(self) -> tuple[np.ndarray, np.ndarray]:
+        """X & Y of Each Game's Oldest Pipe (Environment.pipes[0])"""
+        return self.pipe_x[self.envs, self.pipe_head], self.pipe_y[self.envs, self.pipe_head]
+
+    def get_states(self) -> np.ndarray:
+        """Same Features as main.get_state for Every Game ; Shape (N, INPUT)"""
+        _, first_y = self.first_pipe()
+        states = np.empty((self.num_envs, self.config.INPUT), dtype=np.float32)
+        states[:, 0] = (self.bird_y + self.config.BIRD_SIZE["Y"] // 2) - first_y
+        states[:, 1] = self.bird_velocity
+        return states
+
+    def update_variables(self, actions:np.ndarray) -> None:
+        """Flap, then Move Pipes & Birds for Next Frame"""
+        self.bird_velocity[actions == 1] -= self.config.FLAP_CONST
+        self.pipe_x[self.pipe_alive] -= self.config.GAME_X_SPEED
+        # Only the Oldest Pipe can Leave the Screen
+        head_x, _ = self.first_pipe()
+        gone = self.pipe_alive[self.envs, self.pipe_head] & (head_x <= -self.config.PIPE_SIZE["X"])
+        self.pipe_alive[gone, self.pipe_head[gone]] = False
+        self.pipe_head[gone] = (self.pipe_head[gone] + 1) % self.max_pipes
+        self.pipe_count[gone] -= 1
+
+        np.clip(self.bird_velocity, -self.config.MAX_VEL, self.config.MAX_VEL, out=self.bird_velocity)
+        self.bird_velocity += self.gravity
+        self.bird_y += np.trunc(self.bird_velocity)
+        self.frames += 1
+
+    def detect_collision(self) -> None:
+        """Vectorized Environment.detect_collision"""
+        bird_y = self.bird_y[:, None]
+        overlap_x = (self.bird_x + self.config.BIRD_SIZE["X"] > self.pipe_x) & (self.bird_x < self.pipe_x + self.config.PIPE_SIZE["X"])
+        outside_gap = (bird_y < self.pipe_y - self.config.PIPE_GAP) | (bird_y + self.config.BIRD_SIZE["Y"] > self.pipe_y + self.config.PIPE_GAP)
+        pipe_hit = (self.pipe_alive & overlap_x & outside_gap).any(axis=1)
+        bounds_hit = (self.bird_y <= self.ceil) | (self.bird_y >= self.floor - self.config.BIRD_SIZE["Y"])
+        self.run = ~(bounds_hit | pipe_hit)
+
+    def reward(self, actions:np.ndarray) -> np.ndarray:
+        """Vectorized Environment.reward"""
+        _, first_y = self.first_pipe()
+        rewards = np.full(self.num_envs, 0.5)
+        in_zone = np.abs((first_y + self.config.PIPE_GAP * self.config.SHIFT_DOWN) - (self.bird_y + self.config.BIRD_SIZE["Y"]//2)) < self.config.PIPE_GAP * self.config.CENTER_FOCUS
+        rewards[in_zone] = 20 + 0.01 * self.score[in_zone]
+        rewards[(self.bird_y + self.config.BIRD_SIZE["Y"] < first_y - self.config.PIPE_GAP) & (actions == 1)] -= 20
+        rewards[(self.bird_y > first_y + self.config.PIPE_GAP) & (actions == 0)] -= 20
+        rewards[~self.run] = -100
+        return rewards
+
+    def pipes_cleared(self) -> np.ndarray:
+        """Vectorized Environment.pipe_cleared ; True where Oldest Pipe was Passed for First Time"""
+        head_x, _ = self.first_pipe()
+        cleared = (self.pipe_count > 0) & (self.bird_x > head_x) & ~self.pipe_cleared[self.envs, self.pipe_head]
+        self.pipe_cleared[self.envs[cleared], self.pipe_head[cleared]] = True
+        self.score += cleared
+        return cleared
+
+    def step(self, actions:np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Play One Frame in Every Game ; Finished Games are Reset Automatically
+        Returns next_states, rewards, dones and scores, all taken before the reset"""
+        actions = np.asarray(actions)
+        self.update_variables(actions)
+        self.detect_collision()
+        rewards = self.reward(actions)
+        self.pipes_cleared()
+
+        next_states = self.get_states()
+        dones = ~self.run
+        scores = self.score.copy()
+        if dones.any():
+            self.episodes[dones] += 1
+            self.reset(dones)
+            self.create_pipe(~dones)
+        else:
+            self.create_pipe()
+        return next_states, rewards, dones, scores
@@ -0,0 +1,141 @@
+import argparse, json, os, time
+import multiprocessing as mp
+import numpy as np
+import constants
+from core.game import Environment, ActionRepeat
+from core.vector import VectorEnvironment
+from inference import NumpyQNetwork
+
+PERCENTILES:tuple[int, ...] = (5, 25, 50, 75, 95, 99)
+
+
+def load_policy(folder:str) -> NumpyQNetwork:
+    """Greedy Policy of a Saved Model ; the Exported .npz, or the .pth's Weights for Older Models"""
+    path = f"{os.path.dirname(os.path.abspath(__file__))}/assets/models/{folder}/{constants.MODEL_NAME['file']}"
+    if os.path.exists(f"{path}.npz"):
+        return NumpyQNetwork.load(f"{path}.npz")
+    import torch
+    checkpoint = torch.load(f"{path}.pth", weights_only=False)
+    return NumpyQNetwork.from_state_dict(checkpoint["model_state_dict"])
+
+
+def evaluate_seeds(policy:NumpyQNetwork, first_seed:int, num_episodes:int, num_envs:int, max_frames:int) -> tuple[np.ndarray, np.ndarray]:
+    """Scores & Frames of Episodes Seeded first_seed .. first_seed + num_episodes - 1 ; Same Games as Environment(seed)
+    Env e Plays Seeds first_seed + e + k * num_envs, so Envs Stop Once their Next Seed is Past the Range"""
+    num_envs = min(num_envs, num_episodes)
+    venv = VectorEnvironment(num_envs, seed=first_seed)
+    scores = np.zeros(num_episodes, dtype=np.int64)
+    frames = np.zeros(num_episodes, dtype=np.int64)
+    active = np.ones(num_envs, dtype=bool)
+    lengths = np.zeros(num_envs, dtype=np.int64)
+    states = venv.get_states()
+    while active.any():
+        actions = policy(states).argmax(axis=1)
+        states, _, dones, step_scores = venv.step(actions)
+        lengths += 1
+        # Cut Episodes at max_frames ; Counted as Finished with their Current Score
+        truncated = ~dones & (lengths >= max_frames)
+        if truncated.any():
+            venv.episodes[truncated] += 1
+            venv.reset(truncated)
+        # step Returns States from before the Reset ; Restarted Games Act on their First State
+        ended = dones | truncated
+        if ended.any():
+            states[ended] = venv.get_states()[ended]
+        for env in np.flatnonzero(active & ended):
+            episode = env + (venv.episodes[env] - 1) * num_envs
+            scores[episode] = step_scores[env]
+            frames[episode] = lengths[env]
+            active[env] = episode + num_envs < num_episodes
+        lengths[ended] = 0
+    return scores, frames
+
+
+def evaluate_scalar(policy:NumpyQNetwork, first_seed:int, num_episodes:int, max_frames:int) -> tuple[np.ndarray, np.ndarray]:
+    """evaluate_seeds One Environment(seed) at a Time ; Reference for check"""
+    scores = np.zeros(num_episodes, dtype=np.int64)
+    frames = np.zeros(num_episodes, dtype=np.int64)
+    for episode in range(num_episodes):
+        game = Environment(seed=first_seed + episode)
+        env = ActionRepeat(game, 1)
+        while game.run and game.frames < max_frames:
+            env.step(int(policy(np.array([game.get_state()], dtype=np.float32)).argmax()))
+        scores[episode], frames[episode] = game.score, game.frames
+    return scores, frames
+
+
+def check(policy:NumpyQNetwork, first_seed:int, num_episodes:int, num_envs:int, max_frames:int) -> bool:
+    """Vectorized & Scalar Games Must End Alike, Truncated Ones Included ; Prints the First Mismatch"""
+    vector_scores, vector_frames = evaluate_seeds(policy, first_seed, num_episodes, num_envs, max_frames)
+    scalar_scores, scalar_frames = evaluate_scalar(policy, first_seed, num_episodes, max_frames)
+    mismatches = np.flatnonzero((vector_scores != scalar_scores) | (vector_frames != scalar_frames))
+    truncated = int((scalar_frames >= max_frames).sum())
+    if len(mismatches):
+        episode = mismatches[0]
+        print(
+            f"{len(mismatches)} of {num_episodes} Episodes Differ ; Seed {first_seed + episode}: " +
+            f"Vector Score {vector_scores[episode]} after {vector_frames[episode]} Frames, Scalar Score {scalar_scores[episode]} after {scalar_frames[episode]} Frames"
+        )
+        return False
+    print(f"Identical ; {num_episodes} Episodes, {truncated} Truncated at {max_frames} Frames")
+    return True
+
+
+def evaluate_worker(args:tuple) -> tuple[np.ndarray, np.ndarray]:
+    return evaluate_seeds(*args)
+
+
+def evaluate(policy:NumpyQNetwork, num_episodes:int, seed:int=0, workers:int=1, num_envs:int=256, max_frames:int=constants.EVAL_MAX_FRAMES) -> dict:
+    """Greedy Policy on num_episodes Seeded Games, Split into Contiguous Seed Ranges over workers Processes"""
+    bounds = np.linspace(0, num_episodes, min(workers, num_episodes) + 1).astype(int)
+    jobs = [(policy, int(seed + start), int(end - start), num_envs, max_frames) for start, end in zip(bounds[:-1], bounds[1:])]
+    start = time.perf_counter()
+    if len(jobs) == 1:
+        results = [evaluate_worker(jobs[0])]
+    else:
+        with mp.get_context("spawn").Pool(len(jobs)) as pool:
+            results = pool.map(evaluate_worker, jobs)
+    elapsed = time.perf_counter() - start
+    scores = np.concatenate([scores for scores, _ in results])
+    frames = np.concatenate([frames for _, frames in results])
+    return {
+        "episodes": num_episodes, "seed": seed, "max_frames": max_frames,
+        "mean": float(scores.mean()), "std": float(scores.std()), "min": int(scores.min()), "max": int(scores.max()),
+        "percentiles": {f"p{p}": float(np.percentile(scores, p)) for p in PERCENTILES},
+        "truncated": int((frames >= max_frames).sum()),
+        "mean_frames": float(frames.mean()),
+        "episodes_per_sec": num_episodes / elapsed,
+        "frames_per_sec": float(frames.sum()) / elapsed,
+        "scores": scores.tolist(),
+    }
+
+
+def print_report(report:dict) -> None:
+    print(
+        f"Episodes: {report['episodes']} (Seeds {report['seed']}..{report['seed'] + report['episodes'] - 1}) ; " +
+        f"Mean Score: {report['mean']:.2f} ± {report['std']:.2f} ; Min: {report['min']} ; Max: {report['max']} ; " +
+        f"Truncated at {report['max_frames']} Frames: {report['truncated']}"
+    )
+    print(" ; ".join(f"{name}: {value:g}" for name, value in report["percentiles"].items()))
+    print(f"Episodes/sec: {report['episodes_per_sec']:.1f} ; Frames/sec: {report['frames_per_sec']:.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Greedy Evaluation of a Saved Model on Seeded Games")
+    parser.add_argument("--model", default=constants.MODEL_NAME["folder"], help="Folder in assets/models")
+    parser.add_argument("--episodes", type=int, default=constants.EVAL_EPISODES)
+    parser.add_argument("--seed", type=int, default=0, help="Episode i plays Environment(seed=seed + i)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Processes, each with its own VectorEnvironment")
+    parser.add_argument("--num-envs", type=int, default=256, help="Games stepped at once per worker")
+    parser.add_argument("--max-frames", type=int, default=constants.EVAL_MAX_FRAMES, help="Episode length cap")
+    parser.add_argument("--output", help="Also write the report (with every score) as JSON")
+    parser.add_argument("--check", action="store_true", help="Only compare the vectorized games with scalar Environment(seed) games")
+    args = parser.parse_args()
+
+    if args.check:
+        raise SystemExit(0 if check(load_policy(args.model), args.seed, args.episodes, args.num_envs, args.max_frames) else 1)
+    report = evaluate(load_policy(args.model), args.episodes, args.seed, args.workers, args.num_envs, args.max_frames)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
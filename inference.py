@@ -0,0 +1,117 @@
+import time, warnings
+import numpy as np
+
+# Only NumPy at Import ; Exported Policies Load & Run without PyTorch or the Training Stack
+BACKENDS:tuple[str, ...] = ("eager", "script", "compile", "numpy")
+
+
+class NumpyQNetwork:
+    """Pure NumPy Forward of QNetwork's ReLU MLP ; Each Layer is (weight.T, bias)"""
+    def __init__(self, layers:list[tuple[np.ndarray, np.ndarray]]):
+        self.layers:list[tuple[np.ndarray, np.ndarray]] = layers
+
+    @classmethod
+    def from_state_dict(cls, state_dict:dict) -> "NumpyQNetwork":
+        """Layers in Registration Order ; Arrays are Views of the Tensors"""
+        names = [name[:-len(".weight")] for name in state_dict if name.endswith(".weight")]
+        if any(state_dict[f"{name}.weight"].ndim != 2 for name in names):
+            raise ValueError("NumPy forward only supports fully connected networks")
+        return cls([(state_dict[f"{name}.weight"].numpy().T, state_dict[f"{name}.bias"].numpy()) for name in names])
+
+    @classmethod
+    def from_model(cls, model) -> "NumpyQNetwork":
+        """Views of model's Parameters ; In-Place Optimizer Steps & load_state_dict Show Up without Copying"""
+        return cls.from_state_dict(model.state_dict())
+
+    @classmethod
+    def load(cls, path:str) -> "NumpyQNetwork":
+        """Policy Written by export_policy"""
+        with np.load(path) as file:
+            return cls([(file[f"weight_{i}"], file[f"bias_{i}"]) for i in range(int(file["num_layers"]))])
+
+    def save(self, path:str) -> None:
+        arrays = {f"weight_{i}": weight for i, (weight, _) in enumerate(self.layers)}
+        arrays |= {f"bias_{i}": bias for i, (_, bias) in enumerate(self.layers)}
+        with open(path, "wb") as file:
+            np.savez(file, num_layers=len(self.layers), **arrays)
+
+    def __call__(self, states:np.ndarray) -> np.ndarray:
+        """Q-Values ; (N, state_size) -> (N, action_size)"""
+        x = states
+        for weight, bias in self.layers[:-1]:
+            x = x @ weight
+            x += bias
+            np.maximum(x, 0, out=x)
+        weight, bias = self.layers[-1]
+        return x @ weight + bias
+
+    def act(self, state:np.ndarray) -> int:
+        """Greedy Action for a Single State"""
+        return int(self(np.asarray(state, dtype=np.float32)[None]).argmax())
+
+
+class TorchForward:
+    """Gradient-Free Call of a Torch Module on NumPy States through a Reused Input Tensor"""
+    def __init__(self, module, state_size:int):
+        import torch
+        self.torch = torch
+        self.module = module
+        self.buffer = torch.zeros((1, state_size))
+
+    def __call__(self, states:np.ndarray) -> np.ndarray:
+        torch = self.torch
+        n = len(states)
+        if n > len(self.buffer):
+            self.buffer = torch.zeros((n, self.buffer.shape[1]))
+        inputs = self.buffer[:n]
+        inputs.copy_(torch.from_numpy(np.ascontiguousarray(states, dtype=np.float32)))
+        with torch.inference_mode():
+            return self.module(inputs).numpy()
+
+
+def build_backend(name:str, model, state_size:int):
+    """Callable from (N, state_size) float32 States to (N, action_size) Q-Values"""
+    if name == "numpy":
+        return NumpyQNetwork.from_model(model)
+    if name == "eager":
+        return TorchForward(model, state_size)
+    import torch
+    if name == "script":
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")     # Tracing is Deprecated Upstream but Still the Fastest Torch Path Here
+            traced = torch.jit.trace(model, torch.zeros((1, state_size)), check_trace=False)
+        return TorchForward(traced, state_size)
+    if name == "compile":
+        return TorchForward(torch.compile(model, dynamic=True), state_size)
+    raise ValueError(f"Unknown inference backend {name}, expected one of {BACKENDS}")
+
+
+def select_backend(model, state_size:int, candidates:tuple[str, ...], calls:int=300):
+    """Fastest Single-State Backend Agreeing with Eager ; Returns (name, backend)"""
+    states = np.random.default_rng(0).normal(scale=100, size=(16, state_size)).astype(np.float32)
+    reference = TorchForward(model, state_size)(states).copy()
+    best = ("eager", TorchForward(model, state_size), float("inf"))
+    for name in candidates:
+        try:
+            backend = build_backend(name, model, state_size)
+            if not np.allclose(backend(states), reference, rtol=1e-4, atol=1e-4):
+                print(f"Inference backend {name} disagrees with eager, skipped")
+                continue
+            state = states[:1]
+            for _ in range(20):
+                backend(state)
+            start = time.perf_counter()
+            for _ in range(calls):
+                backend(state)
+            elapsed = time.perf_counter() - start
+        except Exception as error:
+            print(f"Inference backend {name} unavailable: {error}")
+            continue
+        if elapsed < best[2]:
+            best = (name, backend, elapsed)
+    return best[0], best[1]
+
+
+def export_policy(state_dict:dict, path:str) -> None:
+    """Standalone Policy File from a QNetwork state_dict ; NumpyQNetwork.load(path).act(state) Needs Only NumPy"""
+    NumpyQNetwork.from_state_dict(state_dict).save(path)
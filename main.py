@@ -1,20 +1,24 @@
 import pygame as pg
-from random import randint
+from random import randint, randrange
 import os
 from agent import QLearningAgent
 from managers.Visuals import VisualManager
+from managers.Spectator import Spectator
 from managers.Audio import AudioManager
-import torch
-from utils.Plotting import Plotter
+import numpy as np
+from utils.AsyncPlotting import AsyncPlotter
+from utils.Profiling import Profiler
+from utils.Metrics import MetricsWriter
 import constants, time, shutil
 from core.game import Environment as Env
+from core.episodes import EpisodeRecorder, EpisodeArchive
 
 
 class FlappyBird:
     def __init__(self):
         self.assets_path:str = os.path.dirname(os.path.abspath(__file__)) + "/assets"
         self.init_pygame()          # PyGame Objects
-        self.plotter = Plotter()    # MatPlotLib Plotting
+        self.plotter = AsyncPlotter(constants.PLOT_INTERACTIVE, constants.PLOT_MAX_HZ, constants.PLOT_MAX_POINTS)    # MatPlotLib Plotting, Off the Training Loop
 
         # Agent Creation
         self.agent = QLearningAgent(
@@ -22,36 +26,48 @@ class FlappyBird:
             action_size=constants.OUTPUT, 
             assets_path=self.assets_path,
             save_interval=constants.SAVE_INTERVAL,
-            memory_size=constants.MEMORY_SIZE
+            memory_size=constants.MEMORY_SIZE,
+            seed=constants.SEED
         )
         if constants.LOAD_MODEL:
             self.agent.load_model()
 
+        # Opt-In Timing of Each Loop Stage, Shared with the Agent for replay()
+        self.profiler = Profiler(
+            constants.PROFILE, constants.PROFILE_WINDOW, constants.PROFILE_TRACE,
+            constants.PROFILE_TRACE_START, constants.PROFILE_TRACE_GAMES, constants.PROFILE_TRACE_FILE
+        )
+        self.agent.profiler = self.profiler
+        if constants.METRICS_LOG:
+            self.agent.metrics = MetricsWriter(f"{self.assets_path}/metrics/Run{time.strftime('%Y%b%d-%H:%M:%S')}", constants.METRICS_CHUNK_SIZE)
+        # Best Games Kept as Seed + Actions ; Watch them with replay.py
+        self.episodes = None
+        if constants.RECORD_TOP_EPISODES:
+            self.episodes = EpisodeArchive(f"{self.assets_path}/episodes/Run{time.strftime('%Y%b%d-%H:%M:%S')}", constants.RECORD_TOP_EPISODES)
+
     def init_pygame(self) -> None:
         """Initializes the PyGame Managers and Variables"""
         self.audio_manager = AudioManager(self.assets_path)
-        self.visual_manager = VisualManager(self.assets_path)
+        # Spectating: the Window Lives in Another Process & Clicks Come Back through spectator.poll_events
+        self.spectator = Spectator(self.assets_path) if constants.SPECTATE else None
+        self.visual_manager = None if self.spectator else VisualManager(self.assets_path)
 
         self.fps:int = constants.FPS
         self.play:bool = constants.SOUND_ENABLED
         self.show:bool = constants.SHOW_GAME
         self.show_reward_zone:bool = True
 
-    def get_state(self, game:Env) -> torch.Tensor:
+    def get_state(self, game:Env) -> np.ndarray:
         """Get Necessary states from Game to Train AI"""
-        return torch.tensor(
-            [
-                float((game.bird.y + constants.BIRD_SIZE["Y"]//2) - game.pipes[0].y),      # First Pipe
-                float(game.bird.velocity),                                                 # Bird's Y Velocity
-            ],
-            dtype=torch.float32
-        )
+        return np.array(game.get_state(), dtype=np.float32)
 
     def handle_event(self, event:pg.event.Event) -> None:
         """Handling All User Inputs"""
         if event.type == pg.QUIT:
             if constants.SAVE_MODEL:
                 self.save_as_model()
+            if self.agent.metrics:
+                self.agent.metrics.close()
             exit(0)
         elif event.type == pg.MOUSEBUTTONDOWN:
             if event.button == 1: # Left Click
@@ -76,42 +92,75 @@ class FlappyBird:
         self.agent.save_model(f"{path}")
 
     def game_loop(self) -> None:
+        profiler = self.profiler
         while True:
-            game:Env = Env()
+            seed = randrange(2**31) if constants.SEED is None else constants.SEED + self.agent.num_games
+            game:Env = Env(seed=seed)
+            recorder = EpisodeRecorder(seed) if self.episodes else None
             if self.agent.num_games == constants.TRAIN_X_ITER:
                 if self.agent.top_score > constants.SAVE_IF_SCORE:
                     self.save_as_model()
+                profiler.close()
+                if self.agent.metrics:
+                    self.agent.metrics.close()
+                if self.spectator:
+                    self.spectator.close()
                 game.run = False
                 return
+            profiler.begin_game()
             while game.run:
-                for event in pg.event.get():
+                t = profiler.tick()
+                for event in (self.spectator.poll_events() if self.spectator else pg.event.get()):
                     self.handle_event(event)
+                t = profiler.add("events", t)
                         
                 game.create_pipe()
 
-                state = self.get_state(game)
+                # New Pipes are Appended Behind pipes[0], so Last Frame's next_state is Still Valid
+                if game.frames == 0:
+                    state = self.get_state(game)
                 action = self.agent.act(state)
+                if recorder:
+                    recorder.record(action)
                 if action == 1:
                     game.bird.flap()
                     self.audio_manager.play_sound("sfx_wing", (self.play and constants.FLAP_SOUND_ENABLED))
+                t = profiler.add("act", t)
 
 #################################### Env ####################################
                 game.update_variables()
+                t = profiler.add("update_variables", t)
                 game.detect_collision()
+                t = profiler.add("detect_collision", t)
                 reward:int = game.reward(action)
 
                 if self.show:
-                    self.visual_manager.draw_window(game.frames, game.bird, game.pipes, reward, game.score, self.fps, self.show_reward_zone)
+                    t = profiler.add("reward", t)
+                    if self.spectator:
+                        self.spectator.publish(game.frames, game.bird, game.pipes, reward, game.score, self.fps, self.show_reward_zone)
+                    else:
+                        self.visual_manager.draw_window(game.frames, game.bird, game.pipes, reward, game.score, self.fps, self.show_reward_zone)
+                    t = profiler.add("draw_window", t)
 
                 if game.pipe_cleared():
                     self.audio_manager.play_sound("sfx_point", (self.play and constants.POINT_SOUND_ENABLED))
+                t = profiler.add("reward", t)
 ##############################################################################
                 
                 next_state = self.get_state(game)
                 self.agent.update_agent(game, state, action, reward, next_state)
+                state = next_state
+                profiler.add("update_agent", t)
 
+            if recorder and self.episodes.qualifies(game.score):
+                self.episodes.add(self.agent.num_games, recorder.finish(game))
             self.agent.update_game_record(game)
+            t = profiler.tick()
             self.plotter.add_game(game.score, (self.agent.all_scores/self.agent.num_games))
+            profiler.add("plot", t)
+            profiler.end_game(game.frames)
+            if profiler.enabled:
+                print(profiler.report())
 
 if __name__ == "__main__":
     game = FlappyBird()
@@ -0,0 +1,44 @@
+import pygame as pg
+import argparse, os
+from managers.Visuals import VisualManager
+from inference import NumpyQNetwork
+from constants import *
+from core.game import *
+
+class FlappyBird:
+    """Watch an Exported Policy Play ; Loads the .npz Written Next to Each Saved Model, No PyTorch Needed
+    With a socket, Actions Come from a Running serve.py Instead"""
+    def __init__(self, policy_path:str, socket:str=None):
+        self.project_path:str = os.path.dirname(os.path.abspath(__file__)) + "/assets"
+        self.visual_manager:VisualManager = VisualManager(self.project_path)
+        if socket:
+            from serve import PolicyClient
+            self.policy:PolicyClient = PolicyClient(socket)
+        else:
+            self.policy:NumpyQNetwork = NumpyQNetwork.load(policy_path)
+        self.fps:int = FPS
+
+    def game_loop(self) -> None:
+        while True:
+            game:Environment = Environment()
+            while game.run:
+                for event in pg.event.get():
+                    if event.type == pg.QUIT:
+                        exit(0)
+                game.create_pipe()
+                if self.policy.act(game.get_state()) == 1:
+                    game.bird.flap()
+                game.update_variables()
+                game.detect_collision()
+                game.pipe_cleared()
+                self.visual_manager.draw_window(game.frames, game.bird, game.pipes, None, game.score, self.fps)
+            print(f"Score: {game.score}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch an Exported Model Play")
+    parser.add_argument("--model", default=MODEL_NAME["folder"], help="Folder in assets/models")
+    parser.add_argument("--socket", help="Ask a running serve.py for actions instead of loading the model")
+    args = parser.parse_args()
+
+    game = FlappyBird(f"{os.path.dirname(os.path.abspath(__file__))}/assets/models/{args.model}/{MODEL_NAME['file']}.npz", args.socket)
+    game.game_loop()
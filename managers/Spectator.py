@@ -0,0 +1,94 @@
+import constants
+import multiprocessing as mp
+import numpy as np
+import pygame as pg
+from types import SimpleNamespace
+from core.game import Environment, Bird, Pipe
+
+# Snapshot Slot Layout ; version | frames | bird_x | bird_y | reward | score | fps | show_reward_zone | num_pipes | (pipe_x, pipe_y) * max_pipes
+VERSION, FRAMES, BIRD_X, BIRD_Y, REWARD, SCORE, FPS, SHOW_REWARD_ZONE, NUM_PIPES = range(9)
+PIPES = 9
+
+
+def spectator_worker(slot, lock, events, sent, stop, assets_path:str, max_pipes:int) -> None:
+    """Render Loop of the Spectator Process ; Draws the Newest Snapshot at its FPS & Forwards Clicks"""
+    from managers.Visuals import VisualManager
+
+    visual_manager = VisualManager(assets_path)
+    shared = np.frombuffer(slot, dtype=np.float64)
+    frame = np.zeros_like(shared)
+    bird = SimpleNamespace(x=0, y=0)
+    pipes = [SimpleNamespace(x=0, y=0) for _ in range(max_pipes)]
+    drawn = 0.0
+
+    while not stop.is_set():
+        for event in pg.event.get():
+            if event.type == pg.QUIT:
+                events.send((pg.QUIT, 0))
+                sent.value += 1
+            elif event.type == pg.MOUSEBUTTONDOWN:
+                events.send((pg.MOUSEBUTTONDOWN, event.button))
+                sent.value += 1
+        with lock:
+            frame[:] = shared
+        fps = int(frame[FPS]) or constants.FPS
+        # Nothing New Published ; Keep the Window Responsive without Redrawing
+        if frame[VERSION] == drawn:
+            visual_manager.clock.tick(fps)
+            continue
+        drawn = frame[VERSION]
+        bird.x, bird.y = frame[BIRD_X], frame[BIRD_Y]
+        num_pipes = int(frame[NUM_PIPES])
+        for pipe, offset in zip(pipes, range(PIPES, PIPES + 2 * num_pipes, 2)):
+            pipe.x, pipe.y = frame[offset], frame[offset + 1]
+        visual_manager.draw_window(
+            int(frame[FRAMES]), bird, pipes[:num_pipes], float(frame[REWARD]), int(frame[SCORE]),
+            fps, bool(frame[SHOW_REWARD_ZONE]) and num_pipes > 0
+        )
+    pg.quit()
+
+
+class Spectator:
+    """Game Window in a Separate Process ; the Trainer Overwrites a Single Snapshot Slot at Full Speed
+    The Window Draws the Newest Snapshot at Display Rate, so Watching Never Throttles Training"""
+    def __init__(self, assets_path:str, config=constants):
+        max_pipes = Environment(config=config).pipes.maxlen
+        ctx = mp.get_context("spawn")
+        self.slot = ctx.RawArray("d", PIPES + 2 * max_pipes)
+        self.lock = ctx.Lock()
+        # (Event Type, Button) of Clicks & Window Close ; sent Counts Them, so Polling Every Frame is a Shared Read
+        self.events, sender = ctx.Pipe(duplex=False)
+        self.sent = ctx.RawValue("q", 0)
+        self.received:int = 0
+        self.stop = ctx.Event()
+        self.frame:np.ndarray = np.frombuffer(self.slot, dtype=np.float64)
+        self.version:int = 0
+        self.process = ctx.Process(target=spectator_worker, args=(self.slot, self.lock, sender, self.sent, self.stop, assets_path, max_pipes), daemon=True)
+        self.process.start()
+
+    def publish(self, iterations:int, bird:Bird, pipes:list[Pipe], reward:float, score:int, fps:int=constants.FPS, show_reward_zone:bool=False) -> None:
+        """Same Arguments as VisualManager.draw_window ; Overwrites the Slot, Never Waits on Drawing"""
+        self.version += 1
+        frame = self.frame
+        with self.lock:
+            frame[VERSION:NUM_PIPES] = self.version, iterations, bird.x, bird.y, reward, score, fps, show_reward_zone
+            frame[NUM_PIPES] = len(pipes)
+            offset = PIPES
+            for pipe in pipes:
+                frame[offset] = pipe.x
+                frame[offset + 1] = pipe.y
+                offset += 2
+
+    def poll_events(self) -> list[pg.event.Event]:
+        """Window Events Since the Last Call ; Rebuilt as PyGame Events for the Usual Handlers"""
+        events = []
+        while self.received < self.sent.value:
+            event_type, button = self.events.recv()
+            events.append(pg.event.Event(event_type, button=button))
+            self.received += 1
+        return events
+
+    def close(self) -> None:
+        """Stop the Spectator Process"""
+        self.stop.set()
+        self.process.join(timeout=5)
@@ -10,6 +10,8 @@ class VisualManager:
         pg.display.set_caption("Flappy Bird")
         self.clock:pg.time.Clock = pg.time.Clock()
         self.font:pg.font.Font = pg.font.Font(f"{self.assets_path}/fonts/retro.ttf", 32)
+        self.overlay:pg.Surface = pg.Surface(self.window.get_size(), pg.SRCALPHA)     # Reused by display_score_zones
+        self.text_cache:dict[str,pg.Surface] = {}       # Rendered Text ; Score & Reward Repeat over Many Frames
         self.assets:dict[str,pg.Surface] = {}
         self.load_assets()
         self.format_assets()
@@ -40,16 +42,24 @@ class VisualManager:
             self.window.blit(self.assets["Pipe"], (pipe.x, pipe.y - 500 - constants.PIPE_GAP))
             self.window.blit(self.assets["Pipe2"], (pipe.x, pipe.y + constants.PIPE_GAP))
 
+    def render_text(self, text:str) -> pg.Surface:
+        """font.render Once per Distinct Text ; Cleared when Full, since Rewards Drift with the Score"""
+        surface = self.text_cache.get(text)
+        if surface is None:
+            if len(self.text_cache) >= 256:
+                self.text_cache.clear()
+            surface = self.text_cache[text] = self.font.render(text, True, (0, 0, 0))
+        return surface
+
     def display_score(self, score:int, reward:int) -> None:
         """Display Score onto Screen"""
-        score_text = self.font.render(f'Score: {score}', True, (0, 0, 0))
-        self.window.blit(score_text, (constants.WINDOW_WIDTH // 2 - 50, 25))
-        reward_text = self.font.render(f'Reward: {reward}', True, (0, 0, 0))
-        self.window.blit(reward_text, (constants.WINDOW_WIDTH // 2 - 50, 50))
+        self.window.blit(self.render_text(f'Score: {score}'), (constants.WINDOW_WIDTH // 2 - 50, 25))
+        self.window.blit(self.render_text(f'Reward: {reward}'), (constants.WINDOW_WIDTH // 2 - 50, 50))
 
     def display_score_zones(self, bird:Bird, pipe:Pipe) -> None:
         """Provides Ability to Display High Reward Zones"""
-        transparent_surface = pg.Surface(self.window.get_size(), pg.SRCALPHA)
+        transparent_surface = self.overlay
+        transparent_surface.fill((0, 0, 0, 0))
         # Green Zone ; High Reward For Bird
         high_reward_zone = pg.Rect(
             0, 
@@ -70,10 +80,9 @@ class VisualManager:
         pg.draw.rect(transparent_surface, (0,0,255,100), bird_hitbox_center)
         # Overlay the transparent surface onto the game's surface to allow transparency
         self.window.blit(transparent_surface, (0, 0))
-        pg.display.update()
 
     def draw_window(self, iterations:int, bird:Bird, pipes:list[Pipe], reward:int, score:int, fps:int=constants.FPS, show_reward_zone:bool=False) -> None:
-        """Main Drawing Function Calling All Other Functions; Granular"""
+        """Main Drawing Function Calling All Other Functions; Granular ; One display.update per Frame"""
         self.draw_landscape(iterations)
         self.draw_objects(bird, pipes)
         self.display_score(score, reward)
@@ -0,0 +1,265 @@
+import json, os, torch
+import numpy as np
+
+class ReplayBuffer:
+    """Fixed Capacity Ring Buffer ; Contiguous Typed Arrays instead of a Deque of Tuples"""
+    ARRAYS:tuple[str, ...] = ("states", "actions", "rewards", "next_states", "dones", "discounts")
+    WHOLE:tuple[str, ...] = ()      # Arrays that Change Outside New Rows ; Snapshotted & Written in Full
+
+    def __init__(self, capacity:int, state_size:int, rng:np.random.Generator=None, state_dtype:type=np.float32, gamma:float=0.9):
+        self.capacity:int = capacity
+        self.rng:np.random.Generator = rng or np.random.default_rng()   # Sampling Stream ; Seeded by the Agent
+        self.states:np.ndarray      = np.zeros((capacity, state_size), dtype=state_dtype)     # uint8 for Pixel Frames
+        self.actions:np.ndarray     = np.zeros(capacity, dtype=np.int8)
+        self.rewards:np.ndarray     = np.zeros(capacity, dtype=np.float32)
+        self.next_states:np.ndarray = np.zeros((capacity, state_size), dtype=state_dtype)
+        self.dones:np.ndarray       = np.zeros(capacity, dtype=bool)
+        self.gamma:float = gamma    # Discount of Rows Added Without One
+        self.discounts:np.ndarray   = np.full(capacity, gamma, dtype=np.float32)   # gamma^n of Each Row's next_state
+        self.position:int = 0       # Next Slot to Write
+        self.size:int = 0
+        self.added:int = 0          # Transitions Ever Written ; Lets Checkpoints Only Save New Rows
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, state, action:int, reward:float, next_state, done:bool, discount:float=None) -> None:
+        """Write Transition in O(1), Overwriting the Oldest when Full"""
+        idx = self.position
+        self.states[idx] = state
+        self.actions[idx] = action
+        self.rewards[idx] = reward
+        self.next_states[idx] = next_state
+        self.dones[idx] = done
+        self.discounts[idx] = self.gamma if discount is None else discount
+        self.position = (idx + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.added += 1
+
+    def add_batch(self, states:np.ndarray, actions:np.ndarray, rewards:np.ndarray, next_states:np.ndarray, dones:np.ndarray, discounts:np.ndarray=None) -> np.ndarray:
+        """Write n Transitions at Once, Wrapping Around ; Returns the Slots Written"""
+        indices = (self.position + np.arange(len(states))) % self.capacity
+        self.states[indices] = states
+        self.actions[indices] = actions
+        self.rewards[indices] = rewards
+        self.next_states[indices] = next_states
+        self.dones[indices] = dones
+        self.discounts[indices] = self.gamma if discounts is None else discounts
+        self.position = int(indices[-1] + 1) % self.capacity
+        self.size = min(self.size + len(states), self.capacity)
+        self.added += len(states)
+        return indices
+
+    def sample_indices(self, batch_size:int) -> np.ndarray:
+        """Uniform Indices, With Replacement"""
+        return self.rng.integers(0, self.size, size=batch_size)
+
+    def gather(self, indices:np.ndarray) -> tuple[torch.Tensor, ...]:
+        """Fancy-Index the Batch & Wrap as Tensors Sharing the Gathered Arrays"""
+        return (
+            torch.from_numpy(self.states[indices]),
+            torch.from_numpy(self.actions[indices].astype(np.int64)).unsqueeze(1),
+            torch.from_numpy(self.rewards[indices]).unsqueeze(1),
+            torch.from_numpy(self.next_states[indices]),
+            torch.from_numpy(self.dones[indices]).unsqueeze(1),
+            torch.from_numpy(self.discounts[indices]).unsqueeze(1),
+        )
+
+    def sample(self, batch_size:int) -> tuple[torch.Tensor, ...]:
+        """States, Actions, Rewards, Next States, Dones, Discounts ; Ready for QLearningAgent.replay"""
+        return self.gather(self.sample_indices(batch_size))
+
+    def meta(self) -> dict:
+        """Scalars Needed to Restore the Ring"""
+        return {"capacity": self.capacity, "position": self.position, "size": self.size, "added": self.added}
+
+    def snapshot(self, since:int) -> tuple[np.ndarray, dict[str, np.ndarray], dict]:
+        """Copies of the Rows Written after the since-th Transition (All Rows if they Wrapped), of the WHOLE Arrays & the Ring Scalars
+        Cheap Enough for the Training Thread ; the Result can be Written by Another Thread"""
+        n = min(self.added - since, self.capacity)
+        indices = (self.position - n + np.arange(n)) % self.capacity
+        return indices, {name: getattr(self, name)[indices] if name not in self.WHOLE else getattr(self, name).copy() for name in self.ARRAYS}, self.meta()
+
+    @classmethod
+    def write_snapshot(cls, path:str, indices:np.ndarray, rows:dict[str, np.ndarray], meta:dict) -> None:
+        """Write Rows in Place into path/<array>.npy (Created Full-Size on First Use), then meta.json through an Atomic Rename
+        Only meta.json is Replaced Atomically ; a Crash Mid-Write can Leave Overwritten Rows that the Previous meta.json Still Counts"""
+        os.makedirs(path, exist_ok=True)
+        for name, values in rows.items():
+            location = f"{path}/{name}.npy"
+            shape = (meta["capacity"],) + values.shape[1:]
+            array = np.load(location, mmap_mode="r+") if os.path.exists(location) else None
+            if array is None or array.shape != shape or array.dtype != values.dtype:
+                array = np.lib.format.open_memmap(location, mode="w+", dtype=values.dtype, shape=shape)
+            if name in cls.WHOLE:
+                array[:] = values
+            else:
+                array[indices] = values
+            array.flush()
+            del array
+        with open(f"{path}/meta.json.tmp", "w") as file:
+            json.dump(meta, file)
+        os.replace(f"{path}/meta.json.tmp", f"{path}/meta.json")
+
+    def load(self, path:str) -> bool:
+        """Memory-Map a Saved Buffer Copy-on-Write ; No Deserialization, Pages are Read on First Touch"""
+        with open(f"{path}/meta.json") as file:
+            meta = json.load(file)
+        if meta["capacity"] != self.capacity:
+            print(f"Saved Memory Capacity {meta['capacity']} differs from MEMORY_SIZE {self.capacity}, not Loaded")
+            return False
+        for name in self.ARRAYS:
+            if os.path.exists(f"{path}/{name}.npy"):
+                setattr(self, name, np.load(f"{path}/{name}.npy", mmap_mode="c"))
+            elif name == "discounts":    # Saved before n-Step Returns ; Every Row was One Step
+                self.discounts[:] = self.gamma
+        self.position, self.size, self.added = meta["position"], meta["size"], meta["added"]
+        return True
+
+
+class SumTree:
+    """Array-Backed Binary Sum Tree ; Root at 1, Leaves at [leaf_offset, 2 * leaf_offset)"""
+    def __init__(self, capacity:int):
+        self.depth:int = max(1, int(np.ceil(np.log2(capacity))))
+        self.leaf_offset:int = 2 ** self.depth
+        self.tree:np.ndarray = np.zeros(2 * self.leaf_offset, dtype=np.float64)
+
+    @property
+    def total(self) -> float:
+        return self.tree[1]
+
+    def rebuild(self) -> None:
+        """Recompute Every Parent from the Leaves ; After Loading Saved Priorities"""
+        for level in range(self.depth - 1, -1, -1):
+            nodes = np.arange(2 ** level, 2 ** (level + 1))
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def update(self, indices:np.ndarray, priorities:np.ndarray) -> None:
+        """Batched Leaf Update ; Parents Recomputed from Children to Avoid Drift"""
+        nodes = np.asarray(indices) + self.leaf_offset
+        self.tree[nodes] = priorities
+        for _ in range(self.depth):
+            nodes = nodes // 2
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, values:np.ndarray) -> np.ndarray:
+        """Batched Descent ; Leaf Index whose Prefix Sum Range Holds Each Value"""
+        nodes = np.ones(len(values), dtype=np.int64)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            go_right = values > self.tree[left]
+            values = np.where(go_right, values - self.tree[left], values)
+            nodes = np.where(go_right, left + 1, left)
+        return nodes - self.leaf_offset
+
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    """Proportional Prioritized Replay ; P(i) = p_i^alpha / sum(p^alpha) with Importance-Sampling Weights"""
+    ARRAYS:tuple[str, ...] = ReplayBuffer.ARRAYS + ("priorities",)
+    WHOLE:tuple[str, ...] = ("priorities",)    # update_priorities Changes Old Rows
+
+    def __init__(self, capacity:int, state_size:int, alpha:float=0.6, beta:float=0.4, beta_increment:float=1e-4, epsilon:float=1e-5, rng:np.random.Generator=None, state_dtype:type=np.float32, gamma:float=0.9):
+        super().__init__(capacity, state_size, rng, state_dtype, gamma)
+        self.tree:SumTree = SumTree(capacity)
+        self.alpha:float = alpha
+        self.beta:float = beta
+        self.beta_increment:float = beta_increment
+        self.epsilon:float = epsilon
+        self.max_priority:float = 1.0   # New Transitions are Sampled at Least Once
+
+    @property
+    def priorities(self) -> np.ndarray:
+        """Leaf Priorities, Aligned with the Transition Arrays"""
+        return self.tree.tree[self.tree.leaf_offset:self.tree.leaf_offset + self.capacity]
+
+    @priorities.setter
+    def priorities(self, values:np.ndarray) -> None:
+        self.tree.tree[self.tree.leaf_offset:self.tree.leaf_offset + self.capacity] = values
+        self.tree.rebuild()
+
+    def meta(self) -> dict:
+        return super().meta() | {"max_priority": self.max_priority, "beta": self.beta}
+
+    def load(self, path:str) -> bool:
+        if not super().load(path):
+            return False
+        with open(f"{path}/meta.json") as file:
+            meta = json.load(file)
+        self.max_priority, self.beta = meta.get("max_priority", self.max_priority), meta.get("beta", self.beta)
+        if not os.path.exists(f"{path}/priorities.npy"):   # Saved from a Uniform Buffer
+            self.priorities = np.where(np.arange(self.capacity) < self.size, self.max_priority, 0.0)
+        return True
+
+    def add(self, state, action:int, reward:float, next_state, done:bool, discount:float=None) -> None:
+        """Write Transition with the Highest Priority Seen so Far"""
+        idx = self.position
+        super().add(state, action, reward, next_state, done, discount)
+        self.tree.update(idx, self.max_priority)
+
+    def add_batch(self, states:np.ndarray, actions:np.ndarray, rewards:np.ndarray, next_states:np.ndarray, dones:np.ndarray, discounts:np.ndarray=None) -> np.ndarray:
+        """Write n Transitions with the Highest Priority Seen so Far"""
+        indices = super().add_batch(states, actions, rewards, next_states, dones, discounts)
+        self.tree.update(indices, self.max_priority)
+        return indices
+
+    def sample_indices(self, batch_size:int) -> np.ndarray:
+        """Stratified Proportional Sampling ; One Value per Equal Slice of the Total Priority"""
+        segment = self.tree.total / batch_size
+        values = (np.arange(batch_size) + self.rng.random(batch_size)) * segment
+        return np.minimum(self.tree.find(values), self.size - 1)
+
+    def sample(self, batch_size:int) -> tuple[tuple[torch.Tensor, ...], np.ndarray, torch.Tensor]:
+        """Batch, its Indices (for update_priorities) & Importance-Sampling Weights"""
+        indices = self.sample_indices(batch_size)
+        probabilities = self.tree.tree[indices + self.tree.leaf_offset] / self.tree.total
+        weights = (self.size * probabilities) ** -self.beta
+        weights /= weights.max()
+        self.beta = min(1.0, self.beta + self.beta_increment)
+        return self.gather(indices), indices, torch.from_numpy(weights.astype(np.float32)).unsqueeze(1)
+
+    def update_priorities(self, indices:np.ndarray, td_errors:np.ndarray) -> None:
+        """New Priorities from the Absolute TD Errors of the Last Batch"""
+        priorities = (np.abs(td_errors) + self.epsilon) ** self.alpha
+        self.max_priority = max(self.max_priority, priorities.max())
+        self.tree.update(indices, priorities)
+
+
+class NStepWindow:
+    """Per-Env Rolling Windows of the Last n Transitions ; Discounted Returns Accumulated as Rewards Arrive
+    A Window Entry Leaves as (s, a, R_n, s_{t+n}, done, gamma^n) after n Steps, or Early when its Game Ends"""
+    def __init__(self, num_envs:int, n:int, gamma:float, state_size:int, state_dtype:type=np.float32):
+        self.num_envs:int = num_envs
+        self.n:int = n
+        self.powers:np.ndarray = gamma ** np.arange(n + 1)             # gamma^k for Every Age
+        self.envs:np.ndarray = np.arange(num_envs)
+        self.states:np.ndarray = np.zeros((num_envs, n, state_size), dtype=state_dtype)
+        self.actions:np.ndarray = np.zeros((num_envs, n), dtype=np.int8)
+        self.returns:np.ndarray = np.zeros((num_envs, n), dtype=np.float64)
+        self.ages:np.ndarray = np.zeros((num_envs, n), dtype=np.int64)  # Rewards Summed so Far ; 0: Empty Slot
+        self.slot:int = 0           # Every Env Steps Together, so One Write Slot Serves All Windows
+
+    def push(self, states:np.ndarray, actions:np.ndarray, rewards:np.ndarray, next_states:np.ndarray, dones:np.ndarray) -> tuple[np.ndarray, ...]:
+        """One Step of Every Env ; Returns the Finished Transitions, Ready for ReplayBuffer.add_batch"""
+        slot = self.slot
+        self.states[:, slot] = states
+        self.actions[:, slot] = actions
+        self.returns[:, slot] = 0.0
+        self.ages[:, slot] = 0
+        # Entry of Age k Gets gamma^k * r ; Empty Slots have Age 0 but are Never Read Before Being Rewritten
+        filled = self.ages > 0
+        filled[:, slot] = True
+        self.returns += np.where(filled, self.powers[self.ages] * np.asarray(rewards, dtype=np.float64)[:, None], 0.0)
+        self.ages += filled
+        ready = filled & ((self.ages == self.n) | np.asarray(dones, dtype=bool)[:, None])
+        env, slots = np.nonzero(ready)
+        transitions = (
+            self.states[env, slots], self.actions[env, slots], self.returns[env, slots],
+            next_states[env], dones[env], self.powers[self.ages[env, slots]],
+        )
+        self.ages[ready] = 0
+        self.slot = (slot + 1) % self.n
+        return transitions
+
+    def clear(self) -> None:
+        """Drop Unfinished Windows ; e.g. when Games are Abandoned without a done"""
+        self.ages[:] = 0
@@ -0,0 +1,68 @@
+import argparse, os, time
+import numpy as np
+import constants
+from agent import QLearningAgent
+from core.vector import VectorEnvironment
+from core.render import PixelRenderer
+from utils.Metrics import MetricsWriter
+
+
+class PixelTrainer:
+    """Headless Training from Stacked Grayscale Frames ; num_envs Games Stepped & Rendered Together"""
+    def __init__(self, num_envs:int=constants.PIXEL_ENVS, config=constants):
+        self.config = config
+        self.assets_path:str = os.path.dirname(os.path.abspath(__file__)) + "/assets"
+        self.venv = VectorEnvironment(num_envs, seed=config.SEED, config=config)
+        self.renderer = PixelRenderer(self.venv, config.PIXEL_HEIGHT, config.PIXEL_WIDTH, config.FRAME_STACK)
+
+        # Agent Creation ; States are Flat uint8 Frame Stacks
+        self.agent = QLearningAgent(
+            state_size=int(np.prod(self.renderer.frame_shape)),
+            action_size=config.OUTPUT,
+            assets_path=self.assets_path,
+            save_interval=config.SAVE_INTERVAL,
+            memory_size=config.MEMORY_SIZE,
+            config=config,
+            seed=config.SEED,
+            network="cnn"
+        )
+        if config.METRICS_LOG:
+            self.agent.metrics = MetricsWriter(f"{self.assets_path}/metrics/Pixels{time.strftime('%Y%b%d-%H:%M:%S')}", config.METRICS_CHUNK_SIZE)
+
+        self.lengths:np.ndarray = np.zeros(num_envs, dtype=np.int64)    # Frames of Each Game in Progress
+        self.total_frames:int = 0
+        self.train_time:float = 0.0
+
+    def train(self, num_games:int=None) -> None:
+        """Step Every Game Until the Agent has Played num_games"""
+        num_games = num_games or self.config.TRAIN_X_ITER
+        states = self.renderer.observation()
+        start = time.perf_counter()
+        while self.agent.num_games < num_games:
+            actions = self.agent.act_batch(states)
+            next_states, rewards, dones, scores = self.renderer.step(actions)
+            self.agent.observe_batch(states, actions, rewards, next_states, dones)
+            self.lengths += 1
+            for env in np.flatnonzero(dones):
+                self.agent.record_game(int(scores[env]), int(self.lengths[env]))
+            self.total_frames += len(actions)
+            self.lengths[dones] = 0
+            states = next_states
+        self.train_time += time.perf_counter() - start
+
+    def finish(self) -> None:
+        """End of Run ; Flush Logs & Report Throughput"""
+        if self.agent.metrics:
+            self.agent.metrics.close()
+        print(f"Frames: {self.total_frames} ; Time: {self.train_time:.1f}s ; Frames/sec: {self.total_frames / max(self.train_time, 1e-9):.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Flappy Bird Training from Pixels")
+    parser.add_argument("--games", type=int, default=constants.TRAIN_X_ITER, help="Number of games to train for")
+    parser.add_argument("--envs", type=int, default=constants.PIXEL_ENVS, help="Games stepped together")
+    args = parser.parse_args()
+
+    trainer = PixelTrainer(args.envs)
+    trainer.train(args.games)
+    trainer.finish()
@@ -0,0 +1,84 @@
+import argparse, glob, os, time
+import constants
+from core.episodes import Replayer, load
+
+SEEK_STEP = 100     # Decisions per Left/Right Press ; x10 with Shift
+
+
+def recordings(paths:list[str]) -> list[str]:
+    """Files as Given, Folders Searched for .npz Recordings"""
+    files = []
+    for path in paths:
+        files += sorted(glob.glob(f"{path}/**/*.npz", recursive=True)) if os.path.isdir(path) else [path]
+    return files
+
+
+def verify(paths:list[str]) -> None:
+    """Re-Simulate Every Recording Headless at Full Speed ; Replayer Raises if One Diverges"""
+    for path in recordings(paths):
+        recording = load(path)
+        start = time.perf_counter()
+        Replayer(recording)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{os.path.basename(path)} ; Identical ; Score: {recording['score']} ; Frames: {recording['frames']} ; " +
+            f"Recording: {os.path.getsize(path)} Bytes ; Frames/sec: {int(recording['frames']) / max(elapsed, 1e-9):.0f}"
+        )
+
+
+def watch(path:str, fps:int=constants.FPS) -> None:
+    """Play a Recording through VisualManager
+    Space: Pause ; Left/Right: Seek (Shift x10) ; Up/Down: Faster/Slower ; Home: Restart ; Q: Quit"""
+    import pygame as pg
+    from managers.Visuals import VisualManager
+
+    replayer = Replayer(load(path))
+    visual_manager = VisualManager(os.path.dirname(os.path.abspath(__file__)) + "/assets")
+    total = len(replayer.actions)
+    speed, paused, caption = 1, False, None
+    while True:
+        for event in pg.event.get():
+            if event.type == pg.QUIT or (event.type == pg.KEYDOWN and event.key == pg.K_q):
+                pg.quit()
+                return
+            if event.type != pg.KEYDOWN:
+                continue
+            step = SEEK_STEP * (10 if event.mod & pg.KMOD_SHIFT else 1)
+            if event.key == pg.K_SPACE:
+                paused = not paused
+            elif event.key == pg.K_RIGHT:
+                replayer.seek(replayer.decision + step)
+            elif event.key == pg.K_LEFT:
+                replayer.seek(replayer.decision - step)
+            elif event.key == pg.K_HOME:
+                replayer.seek(0)
+            elif event.key == pg.K_UP:
+                speed *= 2
+            elif event.key == pg.K_DOWN:
+                speed = max(1, speed // 2)
+
+        if not paused:
+            for _ in range(speed):
+                replayer.step()
+        game = replayer.game
+        state = "Paused" if paused else "End" if replayer.done else f"x{speed}"
+        if caption != (replayer.decision, state):
+            caption = (replayer.decision, state)
+            pg.display.set_caption(f"Flappy Bird Replay ; Decision {replayer.decision}/{total} ; {state}")
+        visual_manager.draw_window(game.frames, game.bird, game.pipes, replayer.reward, game.score, fps)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay Recorded Games (assets/episodes) from their Seed & Actions")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    verify_parser = subparsers.add_parser("verify", help="Re-simulate headless and check each recording ends as recorded")
+    verify_parser.add_argument("paths", nargs="+", help=".npz recordings or folders of them")
+    watch_parser = subparsers.add_parser("watch", help="Play a recording with seek & fast-forward")
+    watch_parser.add_argument("path", help=".npz recording")
+    watch_parser.add_argument("--fps", type=int, default=constants.FPS)
+    args = parser.parse_args()
+
+    if args.command == "verify":
+        verify(args.paths)
+    else:
+        watch(args.path, args.fps)
@@ -0,0 +1,278 @@
+import argparse, os, selectors, socket, time
+import numpy as np
+import constants
+from core.game import Environment, ActionRepeat
+from inference import NumpyQNetwork
+
+# Wire Format ; Request: state_size float32 (Native Byte Order), Reply: 1 Byte Action
+PERCENTILES:tuple[float, ...] = (50, 99, 99.9)
+
+
+def latency_summary(latencies:np.ndarray) -> str:
+    """Percentiles of Latencies in Seconds, Printed in Microseconds"""
+    return " ; ".join(f"p{p:g}: {np.percentile(latencies, p) * 1e6:.0f}us" for p in PERCENTILES)
+
+
+class BatchStats:
+    """Request Latencies (Arrival to Reply) & Batch Sizes since the Last reset"""
+    def __init__(self, max_batch:int, capacity:int=1_000_000):
+        self.batch_counts:np.ndarray = np.zeros(max_batch + 1, dtype=np.int64)
+        self.latencies:np.ndarray = np.zeros(capacity, dtype=np.float64)     # Seconds ; Ring, Oldest Overwritten
+        self.requests:int = 0
+        self.start:float = time.perf_counter()
+
+    def add_batch(self, latencies:np.ndarray) -> None:
+        n = len(latencies)
+        self.batch_counts[n] += 1
+        self.latencies[(self.requests + np.arange(n)) % len(self.latencies)] = latencies
+        self.requests += n
+
+    def reset(self) -> None:
+        self.batch_counts[:] = 0
+        self.requests = 0
+        self.start = time.perf_counter()
+
+    def report(self) -> str:
+        """Throughput, Latency Percentiles & Batch Sizes in Power-of-Two Buckets"""
+        if not self.requests:
+            return "Requests: 0"
+        elapsed = time.perf_counter() - self.start
+        sizes = np.flatnonzero(self.batch_counts)
+        batches = self.batch_counts[sizes]
+        buckets = {}
+        for size, count in zip(sizes, batches):
+            low = 1 << (int(size).bit_length() - 1)
+            buckets[low] = buckets.get(low, 0) + count
+        return (
+            f"Requests: {self.requests} ; Requests/sec: {self.requests / elapsed:.0f} ; " +
+            latency_summary(self.latencies[:min(self.requests, len(self.latencies))]) + " ; " +
+            f"Batches: {batches.sum()} ; Mean Batch: {self.requests / batches.sum():.1f}\n" +
+            "Batch Sizes: " + " ; ".join(
+                f"{low}-{2 * low - 1}: {100 * count / batches.sum():.1f}%" if low > 1 else f"1: {100 * count / batches.sum():.1f}%"
+                for low, count in sorted(buckets.items())
+            )
+        )
+
+
+class PolicyServer:
+    """Greedy Actions for Many Local Clients over a Unix Socket ; One Forward Pass per Micro-Batch
+    A Batch is Answered when it Holds max_batch States, when Every Connected Client has a Request in it,
+    or max_latency Seconds after its First Request Arrived ; an Idle Connection Makes Every Batch Wait the Full max_latency"""
+    def __init__(self, policy:NumpyQNetwork, path:str, state_size:int=constants.INPUT, max_batch:int=constants.SERVE_MAX_BATCH, max_latency:float=constants.SERVE_MAX_LATENCY_MS / 1000):
+        self.policy:NumpyQNetwork = policy
+        self.path:str = path
+        self.state_size:int = state_size
+        self.request_size:int = 4 * state_size
+        self.max_batch:int = max_batch
+        self.max_latency:float = max_latency
+        ## Pending Batch ; Preallocated, Filled in Arrival Order
+        self.states:np.ndarray = np.zeros((max_batch, state_size), dtype=np.float32)
+        self.arrivals:np.ndarray = np.zeros(max_batch, dtype=np.float64)
+        self.clients:list[socket.socket] = [None] * max_batch
+        self.waiting:set[socket.socket] = set()     # Distinct Clients with a Request in the Pending Batch
+        self.pending:int = 0
+        self.deadline:float = float("inf")
+        self.stats:BatchStats = BatchStats(max_batch)
+
+        if os.path.exists(path):     # Stale Socket of a Previous Server
+            os.remove(path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(path)
+        self.listener.listen(1024)
+        self.listener.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        self.buffers:dict[socket.socket, bytearray] = {}     # Partial Requests per Client
+
+    def serve_forever(self, report_every:float=10.0) -> None:
+        """Accept, Batch & Answer until Interrupted ; Prints BatchStats Every report_every Seconds"""
+        next_report = time.perf_counter() + report_every
+        try:
+            while True:
+                now = time.perf_counter()
+                timeout = min(self.deadline, next_report) - now if report_every else self.deadline - now
+                for key, _ in self.selector.select(None if timeout == float("inf") else max(timeout, 0.0)):
+                    if key.fileobj is self.listener:
+                        self.accept()
+                    else:
+                        self.read(key.fileobj)
+                now = time.perf_counter()
+                if self.pending and (now >= self.deadline or len(self.waiting) >= len(self.buffers)):
+                    self.flush()
+                if report_every and now >= next_report:
+                    print(self.stats.report())
+                    self.stats.reset()
+                    next_report = now + report_every
+        except KeyboardInterrupt:
+            print(self.stats.report())
+        finally:
+            self.close()
+
+    def accept(self) -> None:
+        client, _ = self.listener.accept()
+        client.setblocking(False)       # A Client that Stops Reading Replies can't Stall the Loop ; Dropped when its Buffer Fills
+        self.selector.register(client, selectors.EVENT_READ)
+        self.buffers[client] = bytearray()
+
+    def drop(self, client:socket.socket) -> None:
+        """Forget a Disconnected Client ; its Pending Requests are Answered into the Void"""
+        self.selector.unregister(client)
+        self.buffers.pop(client, None)
+        self.waiting.discard(client)
+        client.close()
+
+    def read(self, client:socket.socket) -> None:
+        """Queue Every Complete Request Received from client"""
+        try:
+            data = client.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self.drop(client)
+            return
+        buffer = self.buffers[client]
+        buffer += data
+        arrival = time.perf_counter()
+        complete = len(buffer) // self.request_size
+        if not complete:
+            return
+        states = np.frombuffer(buffer, dtype=np.float32, count=complete * self.state_size).reshape(complete, self.state_size)
+        start = 0
+        while start < complete:
+            if not self.pending:
+                self.deadline = arrival + self.max_latency
+            n = min(complete - start, self.max_batch - self.pending)
+            self.states[self.pending:self.pending + n] = states[start:start + n]
+            self.arrivals[self.pending:self.pending + n] = arrival
+            self.clients[self.pending:self.pending + n] = [client] * n
+            self.pending += n
+            self.waiting.add(client)
+            start += n
+            if self.pending == self.max_batch:
+                self.flush()
+                if client not in self.buffers:      # Dropped by flush ; the Rest of its Requests Go Unanswered
+                    return
+        del states
+        del buffer[:complete * self.request_size]
+
+    def flush(self) -> None:
+        """One Forward Pass for the Pending Batch ; Replies Grouped per Client, in Request Order"""
+        n = self.pending
+        actions = self.policy(self.states[:n]).argmax(axis=1).astype(np.uint8)
+        clients = self.clients
+        start = 0
+        for i in range(1, n + 1):
+            if i == n or clients[i] is not clients[start]:
+                client = clients[start]
+                if client in self.buffers:
+                    try:
+                        client.sendall(actions[start:i].tobytes())
+                    except OSError:
+                        self.drop(client)
+                start = i
+        self.stats.add_batch(time.perf_counter() - self.arrivals[:n])
+        self.clients[:n] = [None] * n
+        self.waiting.clear()
+        self.pending = 0
+        self.deadline = float("inf")
+
+    def close(self) -> None:
+        for client in list(self.buffers):
+            self.drop(client)
+        self.selector.close()
+        self.listener.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class PolicyClient:
+    """Blocking Client of a PolicyServer ; Same act() as NumpyQNetwork, so Game Loops can Use Either"""
+    def __init__(self, path:str=constants.SERVE_SOCKET):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(path)
+
+    def act(self, state) -> int:
+        """Greedy Action for a Single State ; One Round Trip"""
+        self.socket.sendall(np.asarray(state, dtype=np.float32).tobytes())
+        reply = self.socket.recv(1)
+        if not reply:
+            raise ConnectionError("Policy Server Closed the Connection")
+        return reply[0]
+
+    def close(self) -> None:
+        self.socket.close()
+
+
+def load_test(path:str, num_players:int, seconds:float) -> None:
+    """num_players Simulated Games in One Process, Each with its Own Connection & One Request in Flight"""
+    selector = selectors.DefaultSelector()
+    players = {}
+    for player in range(num_players):
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(path)
+        game = Environment(seed=player)
+        players[client] = [game, ActionRepeat(game, 1), 0.0]
+        selector.register(client, selectors.EVENT_READ)
+    latencies = np.zeros(1_000_000, dtype=np.float64)      # Client-Side Round Trips ; Ring
+    decisions, games, scores = 0, 0, 0
+
+    def request(client:socket.socket) -> None:
+        players[client][2] = time.perf_counter()
+        client.sendall(np.array(players[client][0].get_state(), dtype=np.float32).tobytes())
+
+    for client in players:
+        request(client)
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for key, _ in selector.select(1.0):
+            client = key.fileobj
+            reply = client.recv(1)
+            if not reply:
+                raise ConnectionError("Policy Server Closed the Connection")
+            game, env, sent = players[client]
+            latencies[decisions % len(latencies)] = time.perf_counter() - sent
+            env.step(reply[0])
+            decisions += 1
+            if not game.run:
+                games, scores = games + 1, scores + game.score
+                game = Environment(seed=num_players + games)
+                players[client][:2] = [game, ActionRepeat(game, 1)]
+            request(client)
+    elapsed = time.perf_counter() - start
+    for client in players:
+        client.close()
+    print(
+        f"Players: {num_players} ; Decisions/sec: {decisions / elapsed:.0f} ; Games: {games} ; " +
+        f"Mean Score: {scores / max(games, 1):.2f} ; Round Trip " + latency_summary(latencies[:min(decisions, len(latencies))])
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a Saved Policy to Local Game Clients over a Unix Socket")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Load a model once and answer state requests in micro-batches")
+    serve_parser.add_argument("--model", default=constants.MODEL_NAME["folder"], help="Folder in assets/models")
+    serve_parser.add_argument("--policy", help="Exported .npz policy file, instead of --model")
+    serve_parser.add_argument("--socket", default=constants.SERVE_SOCKET)
+    serve_parser.add_argument("--max-batch", type=int, default=constants.SERVE_MAX_BATCH)
+    serve_parser.add_argument("--max-latency-ms", type=float, default=constants.SERVE_MAX_LATENCY_MS, help="Longest a request waits for its batch")
+    serve_parser.add_argument("--report-every", type=float, default=constants.SERVE_REPORT_EVERY, help="Seconds between stats lines ; 0: only on exit")
+    bench_parser = subparsers.add_parser("bench", help="Play many simulated games against a running server")
+    bench_parser.add_argument("--socket", default=constants.SERVE_SOCKET)
+    bench_parser.add_argument("--players", type=int, default=200)
+    bench_parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        if args.policy:
+            policy = NumpyQNetwork.load(args.policy)
+        else:
+            from evaluate import load_policy
+            policy = load_policy(args.model)
+        server = PolicyServer(policy, args.socket, constants.INPUT, args.max_batch, args.max_latency_ms / 1000)
+        print(f"Serving on {args.socket} ; Max Batch: {args.max_batch} ; Max Latency: {args.max_latency_ms}ms")
+        server.serve_forever(args.report_every)
+    else:
+        load_test(args.socket, args.players, args.seconds)
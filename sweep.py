@@ -0,0 +1,121 @@
+import argparse, csv, itertools, json, math, os, random, time
+import multiprocessing as mp
+import numpy as np
+
+# Every Trial Trains Headless & Leaves No Files Behind
+TRIAL_DEFAULTS = {"SAVE_MODEL": False, "LOAD_MODEL": False, "PRINT_SCORES": False, "METRICS_LOG": False, "PROFILE": False, "RECORD_TOP_EPISODES": 0}
+
+
+def grid_search(parameters:dict) -> list[dict]:
+    """Every Combination of the Listed Values"""
+    names = list(parameters)
+    return [dict(zip(names, values)) for values in itertools.product(*(parameters[name] for name in names))]
+
+
+def random_search(parameters:dict, num_trials:int, rng:random.Random) -> list[dict]:
+    """num_trials Samples ; a List is Picked From, {"min", "max", "log", "int"} is Sampled Uniformly (in Log Space if log)"""
+    def sample(spec):
+        if isinstance(spec, list):
+            return rng.choice(spec)
+        low, high = spec["min"], spec["max"]
+        value = math.exp(rng.uniform(math.log(low), math.log(high))) if spec.get("log") else rng.uniform(low, high)
+        return round(value) if spec.get("int") else value
+    return [{name: sample(spec) for name, spec in parameters.items()} for _ in range(num_trials)]
+
+
+def make_rungs(min_games:int, max_games:int, eta:int) -> list[int]:
+    """Games Played at Each Successive Halving Checkpoint ; min_games * eta^k, Ending at max_games"""
+    rungs, games = [], min_games
+    while games < max_games:
+        rungs.append(games)
+        games *= eta
+    return rungs + [max_games]
+
+
+def promote(metric:float, results:list[float], eta:int) -> bool:
+    """Asynchronous Successive Halving ; Continue only if in the Top 1/eta of the Trials that Reached this Rung"""
+    if len(results) < eta:
+        return True
+    cutoff = sorted(results, reverse=True)[max(1, len(results) // eta) - 1]
+    return metric >= cutoff
+
+
+def run_trial(trial_id:int, overrides:dict, rungs:list[int], eta:int, window:int, seed:int, rung_results, lock) -> dict:
+    """Train One Config Headless in this Worker, Stopping Early at a Rung if it Falls Behind"""
+    import torch
+    from config import Config
+    from train import Trainer
+    torch.set_num_threads(1)    # One Core per Trial ; the Pool Spreads Trials over the Box
+
+    config = Config.from_constants(**({"SEED": seed} | overrides | TRIAL_DEFAULTS))
+    trainer = Trainer(config=config)
+    start, status, metric = time.perf_counter(), "completed", 0.0
+    for rung in rungs:
+        trainer.train(rung + 1)     # Agent Counts Games from 1
+        metric = float(np.mean(trainer.scores[-window:]))
+        with lock:
+            results = rung_results.get(rung, []) + [metric]
+            rung_results[rung] = results
+        if rung != rungs[-1] and not promote(metric, results, eta):
+            status = "stopped"
+            break
+    return {
+        "trial": trial_id, **overrides,
+        "status": status, "games": len(trainer.scores), "metric": round(metric, 3),
+        "top_score": trainer.agent.top_score, "frames": trainer.total_frames, "seconds": round(time.perf_counter() - start, 1),
+    }
+
+
+def print_table(rows:list[dict]) -> None:
+    """Aligned Text Table"""
+    columns = list(rows[0])
+    widths = {column: max(len(column), *(len(str(row[column])) for row in rows)) for column in columns}
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    for row in rows:
+        print("  ".join(str(row[column]).ljust(widths[column]) for column in columns))
+
+
+def sweep(spec:dict, workers:int) -> list[dict]:
+    """Run Every Trial of spec in a Process Pool ; Rows Sorted Best First"""
+    rng = random.Random(spec.get("seed", 0))
+    if spec.get("method", "grid") == "grid":
+        trials = grid_search(spec["parameters"])
+    else:
+        trials = random_search(spec["parameters"], spec["trials"], rng)
+    eta = spec.get("eta", 3)
+    rungs = make_rungs(spec.get("min_games", spec["games"]), spec["games"], eta)
+    window = spec.get("window", 20)
+    print(f"{len(trials)} Trials ; Rungs at {rungs} Games ; {workers} Workers")
+
+    ctx = mp.get_context("spawn")
+    with ctx.Manager() as manager, ctx.Pool(workers) as pool:
+        rung_results, lock = manager.dict(), manager.Lock()
+        pending = [
+            pool.apply_async(run_trial, (i, overrides, rungs, eta, window, spec.get("seed", 0) + i, rung_results, lock))
+            for i, overrides in enumerate(trials)
+        ]
+        rows = []
+        for result in pending:
+            rows.append(result.get())
+            row = rows[-1]
+            print(f"Trial {row['trial']} {row['status']} after {row['games']} games ; Metric: {row['metric']}")
+    return sorted(rows, key=lambda row: (row["status"] != "completed", -row["metric"]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel Hyperparameter Sweep over constants.py")
+    parser.add_argument("spec", help="JSON sweep spec")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Trials trained in parallel")
+    parser.add_argument("--output", help="Also write the results table as CSV")
+    args = parser.parse_args()
+
+    with open(args.spec) as file:
+        spec = json.load(file)
+    rows = sweep(spec, args.workers)
+    print_table(rows)
+    if args.output:
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        with open(args.output, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
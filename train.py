@@ -0,0 +1,164 @@
+import argparse, os, shutil, time
+import numpy as np
+import constants
+from random import randrange
+from agent import QLearningAgent
+from core.game import Environment as Env, ActionRepeat
+from core.episodes import EpisodeRecorder, EpisodeArchive
+from utils.Profiling import Profiler
+from utils.Metrics import MetricsWriter
+
+
+class Trainer:
+    """Headless Training Loop ; PyGame & MatPlotLib are Only Imported when Visuals are Requested"""
+    def __init__(self, show:bool=False, plot:bool=False, config=constants, spectate:bool=False):
+        self.config = config
+        self.assets_path:str = os.path.dirname(os.path.abspath(__file__)) + "/assets"
+        self.show:bool = show or spectate
+        self.visual_manager = None
+        self.spectator = None
+        self.plotter = None
+        if spectate:
+            import pygame as pg
+            from managers.Spectator import Spectator
+            self.pg = pg
+            self.spectator = Spectator(self.assets_path, self.config)
+        elif show:
+            import pygame as pg
+            from managers.Visuals import VisualManager
+            self.pg = pg
+            self.visual_manager = VisualManager(self.assets_path)
+        if plot:
+            from utils.AsyncPlotting import AsyncPlotter
+            self.plotter = AsyncPlotter(self.config.PLOT_INTERACTIVE, self.config.PLOT_MAX_HZ, self.config.PLOT_MAX_POINTS)
+
+        # Agent Creation
+        self.agent = QLearningAgent(
+            state_size=self.config.INPUT,
+            action_size=self.config.OUTPUT,
+            assets_path=self.assets_path,
+            save_interval=self.config.SAVE_INTERVAL,
+            memory_size=self.config.MEMORY_SIZE,
+            config=self.config,
+            seed=self.config.SEED
+        )
+        if self.config.LOAD_MODEL:
+            self.agent.load_model()
+
+        self.total_frames:int = 0
+        self.scores:list[int] = []
+        self.train_time:float = 0.0
+        self.profiler = Profiler(
+            self.config.PROFILE, self.config.PROFILE_WINDOW, self.config.PROFILE_TRACE,
+            self.config.PROFILE_TRACE_START, self.config.PROFILE_TRACE_GAMES, self.config.PROFILE_TRACE_FILE
+        )
+        self.agent.profiler = self.profiler
+        if self.config.METRICS_LOG:
+            self.agent.metrics = MetricsWriter(f"{self.assets_path}/metrics/Run{time.strftime('%Y%b%d-%H:%M:%S')}", self.config.METRICS_CHUNK_SIZE)
+        self.episodes = None
+        if self.config.RECORD_TOP_EPISODES:
+            self.episodes = EpisodeArchive(f"{self.assets_path}/episodes/Run{time.strftime('%Y%b%d-%H:%M:%S')}", self.config.RECORD_TOP_EPISODES)
+
+    def get_state(self, game:Env) -> np.ndarray:
+        """Get Necessary states from Game to Train AI"""
+        return np.array(game.get_state(), dtype=np.float32)
+
+    def game_seed(self) -> int:
+        """Game n Plays Seed SEED + n ; a Random Seed Without a SEED, so Any Game can be Recorded"""
+        return randrange(2**31) if self.config.SEED is None else self.config.SEED + self.agent.num_games
+
+    def handle_events(self) -> None:
+        """Keep the Window Responsive ; Only Called when Visuals are Shown"""
+        for event in (self.spectator.poll_events() if self.spectator else self.pg.event.get()):
+            if event.type == self.pg.QUIT:
+                self.show = False
+
+    def play_game(self) -> Env:
+        """Play & Learn from a Single Game"""
+        profiler = self.profiler
+        seed = self.game_seed()
+        game:Env = Env(seed=seed, config=self.config)
+        recorder = EpisodeRecorder(seed, self.config.ACTION_REPEAT) if self.episodes else None
+        env = ActionRepeat(game, self.config.ACTION_REPEAT, recorder)
+        state = self.get_state(game)
+        while game.run:
+            t = profiler.tick()
+            action = self.agent.act(state)
+            t = profiler.add("act", t)
+            reward:float = env.step(action)
+            t = profiler.add("env", t)
+
+            if self.show:
+                self.handle_events()
+                if self.spectator:
+                    self.spectator.publish(game.frames, game.bird, game.pipes, reward, game.score)
+                else:
+                    self.visual_manager.draw_window(game.frames, game.bird, game.pipes, reward, game.score)
+                t = profiler.add("draw_window", t)
+
+            next_state = self.get_state(game)
+            self.agent.update_agent(game, state, action, reward, next_state)
+            state = next_state
+            profiler.add("update_agent", t)
+        if recorder and self.episodes.qualifies(game.score):
+            self.episodes.add(self.agent.num_games, recorder.finish(game))
+        return game
+
+    def train(self, num_games:int=None) -> None:
+        """Train until the Agent has Played num_games ; Can be Called Again to Keep Training"""
+        num_games = num_games or self.config.TRAIN_X_ITER
+        profiler = self.profiler
+        while self.agent.num_games < num_games:
+            profiler.begin_game()
+            start = time.perf_counter()
+            game = self.play_game()
+            self.train_time += time.perf_counter() - start
+            self.total_frames += game.frames
+            self.scores.append(game.score)
+
+            self.agent.update_game_record(game)
+            if self.plotter:
+                t = profiler.tick()
+                self.plotter.add_game(game.score, (self.agent.all_scores/self.agent.num_games))
+                profiler.add("plot", t)
+            profiler.end_game(game.frames)
+            if profiler.enabled:
+                print(profiler.report())
+
+    def finish(self) -> None:
+        """End of Run ; Flush Logs, Report Throughput, Save & Close Visuals"""
+        self.profiler.close()
+        if self.agent.metrics:
+            self.agent.metrics.close()
+        print(f"Frames: {self.total_frames} ; Time: {self.train_time:.1f}s ; Frames/sec: {self.total_frames / max(self.train_time, 1e-9):.0f}")
+        if self.config.SAVE_MODEL and self.agent.top_score > self.config.SAVE_IF_SCORE:
+            self.save_as_model()
+        if self.plotter:
+            self.plotter.close()
+        if self.spectator:
+            self.spectator.close()
+
+    def save_as_model(self) -> None:
+        """Save the Snapshot of the Used Model ; Same Layout as main.FlappyBird.save_as_model"""
+        folder_name = f"Model{time.strftime('%Y%b%d-%H:%M:%S')}"
+        path = f"{self.assets_path}/models/{folder_name}"
+        os.makedirs(path)
+
+        for file in self.config.SAVE_FILES:
+            shutil.copyfile(f"{os.path.dirname(os.path.abspath(__file__))}/{file}.py", f"{path}/{file}.py")
+        if self.plotter:
+            self.plotter.save_graph(f"{path}")
+        self.agent.save_model(f"{path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Flappy Bird Training")
+    parser.add_argument("--games", type=int, default=constants.TRAIN_X_ITER, help="Number of games to train for")
+    parser.add_argument("--show", action="store_true", help="Draw the game with PyGame")
+    parser.add_argument("--spectate", action="store_true", help="Draw the game from a separate process without slowing training")
+    parser.add_argument("--plot", action="store_true", help="Plot scores with MatPlotLib")
+    args = parser.parse_args()
+
+    trainer = Trainer(show=args.show, plot=args.plot, spectate=args.spectate)
+    trainer.train(args.games)
+    trainer.finish()
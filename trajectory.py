@@ -0,0 +1,129 @@
+import argparse
+import numpy as np
+import constants
+from agent import QLearningAgent
+from core.game import Environment as Env, ActionRepeat
+from core.vector import VectorEnvironment
+
+# Arrays of a Recorded Episode ; Compared Frame by Frame on Replay
+FIELDS:tuple[str, ...] = ("states", "actions", "rewards", "next_states", "dones")
+
+
+class ScalarEngine:
+    """Reference Engine ; core.game.Environment Stepped Frame by Frame, as train.Trainer Does"""
+    def __init__(self, seed:int, config=constants):
+        self.game = Env(seed=seed, config=config)
+        self.env = ActionRepeat(self.game, 1)
+
+    def state(self) -> np.ndarray:
+        return np.array(self.game.get_state(), dtype=np.float32)
+
+    def step(self, action:int) -> tuple[np.ndarray, float, bool]:
+        reward = self.env.step(action)
+        return self.state(), reward, not self.game.run
+
+    @property
+    def score(self) -> int:
+        return self.game.score
+
+
+class VectorEngine:
+    """core.vector.VectorEnvironment with a Single Game ; Episode 0 Uses the Same Seed as Environment(seed)"""
+    def __init__(self, seed:int, config=constants):
+        self.venv = VectorEnvironment(1, seed=seed, config=config)
+        self.last_score:int = 0
+
+    def state(self) -> np.ndarray:
+        return self.venv.get_states()[0]
+
+    def step(self, action:int) -> tuple[np.ndarray, float, bool]:
+        next_states, rewards, dones, scores = self.venv.step(np.array([action]))
+        self.last_score = int(scores[0])
+        return next_states[0], float(rewards[0]), bool(dones[0])
+
+    @property
+    def score(self) -> int:
+        return self.last_score
+
+
+ENGINES:dict[str, type] = {"scalar": ScalarEngine, "vector": VectorEngine}
+
+
+def make_agent(seed:int, config=constants) -> QLearningAgent:
+    """Seeded Agent ; Same Weights, Exploration & Replay Samples on Every Call"""
+    return QLearningAgent(config.INPUT, config.OUTPUT, assets_path="", memory_size=config.MEMORY_SIZE, config=config, seed=seed)
+
+
+def rollout(engine:str, seed:int, actions:np.ndarray=None, learn:bool=True, max_frames:int=5000, config=constants) -> dict[str, np.ndarray]:
+    """Play One Seeded Episode ; Actions Come from a Seeded Agent (Learning if learn) or are Replayed from actions"""
+    game = ENGINES[engine](seed, config)
+    agent = make_agent(seed, config) if actions is None else None
+    record:dict[str, list] = {name: [] for name in FIELDS}
+    state = game.state()
+    for frame in range(max_frames if actions is None else len(actions)):
+        action = agent.act(state) if actions is None else int(actions[frame])
+        next_state, reward, done = game.step(action)
+        if agent and learn:
+            agent.observe(state, action, reward, next_state, done)
+        for name, value in zip(FIELDS, (state, action, reward, next_state, done)):
+            record[name].append(value)
+        state = next_state
+        if done:
+            break
+    return {
+        "seed": np.int64(seed), "score": np.int64(game.score),
+        "states": np.array(record["states"], dtype=np.float32).reshape(-1, config.INPUT),
+        "actions": np.array(record["actions"], dtype=np.int8),
+        "rewards": np.array(record["rewards"], dtype=np.float64),
+        "next_states": np.array(record["next_states"], dtype=np.float32).reshape(-1, config.INPUT),
+        "dones": np.array(record["dones"], dtype=bool),
+    }
+
+
+def compare(expected:dict[str, np.ndarray], actual:dict[str, np.ndarray]) -> None:
+    """Assert Bitwise Identical Episodes ; Reports the First Diverging Frame"""
+    frames = min(len(expected["actions"]), len(actual["actions"]))
+    for name in FIELDS:
+        mismatch = np.flatnonzero((expected[name][:frames] != actual[name][:frames]).reshape(frames, -1).any(axis=1))
+        assert len(mismatch) == 0, f"{name} Diverge at Frame {mismatch[0]}: {expected[name][mismatch[0]]} != {actual[name][mismatch[0]]}"
+    assert len(expected["actions"]) == len(actual["actions"]), f"Episode Length {len(expected['actions'])} != {len(actual['actions'])}"
+    assert expected["score"] == actual["score"], f"Score {expected['score']} != {actual['score']}"
+
+
+def save(path:str, record:dict[str, np.ndarray]) -> None:
+    np.savez_compressed(path, **record)
+
+
+def load(path:str) -> dict[str, np.ndarray]:
+    with np.load(path) as file:
+        return dict(file)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record a Seeded Episode & Check Engines / Agents Replay it Bit for Bit")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    record_parser = subparsers.add_parser("record", help="Play a seeded episode with the reference engine")
+    record_parser.add_argument("output", help=".npz file to write")
+    record_parser.add_argument("--seed", type=int, default=0)
+    record_parser.add_argument("--max-frames", type=int, default=5000)
+    record_parser.add_argument("--no-learn", action="store_true", help="Act without training the agent")
+    verify_parser = subparsers.add_parser("verify", help="Replay a recording and assert identical states, rewards & actions")
+    verify_parser.add_argument("recording", help=".npz file written by record")
+    verify_parser.add_argument("--engine", choices=list(ENGINES), default="scalar")
+    verify_parser.add_argument("--max-frames", type=int, default=5000)
+    verify_parser.add_argument("--no-learn", action="store_true", help="Must match how the recording was made")
+    verify_parser.add_argument("--actions", action="store_true", help="Replay the recorded actions (engine only) instead of re-running the agent")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record = rollout("scalar", args.seed, learn=not args.no_learn, max_frames=args.max_frames)
+        save(args.output, record)
+        print(f"Recorded Seed {args.seed} ; {len(record['actions'])} Frames ; Score: {record['score']}")
+    else:
+        expected = load(args.recording)
+        actual = rollout(
+            args.engine, int(expected["seed"]), expected["actions"] if args.actions else None,
+            learn=not args.no_learn, max_frames=args.max_frames
+        )
+        compare(expected, actual)
+        print(f"Identical ; {len(actual['actions'])} Frames on the {args.engine} Engine")
@@ -0,0 +1,103 @@
+import queue, time
+import multiprocessing as mp
+
+class History:
+    """Bounded Series ; Neighbouring Points are Averaged in Pairs Whenever max_points is Reached"""
+    def __init__(self, max_points:int):
+        self.max_points:int = max_points + max_points % 2
+        self.x:list = []
+        self.y:list = []
+        self.stride:int = 1         # Games per Stored Point
+        self.count:int = 0
+        self.pending_sum:float = 0.0
+        self.pending:int = 0
+
+    def add(self, value:float) -> None:
+        """Accumulate a Game ; O(1) Amortized"""
+        self.count += 1
+        self.pending_sum += value
+        self.pending += 1
+        if self.pending < self.stride:
+            return
+        self.x.append(self.count)
+        self.y.append(self.pending_sum / self.pending)
+        self.pending_sum, self.pending = 0.0, 0
+        if len(self.y) >= self.max_points:
+            self.x = self.x[1::2]
+            self.y = [(a + b) / 2 for a, b in zip(self.y[::2], self.y[1::2])]
+            self.stride *= 2
+
+
+def plot_worker(messages, replies, interactive:bool, max_hz:float, max_points:int) -> None:
+    """Render Loop of the Plotting Process ; Redraws at Most max_hz Times per Second"""
+    import matplotlib
+    if not interactive:
+        matplotlib.use("Agg")
+    from utils.Plotting import Plotter
+
+    plotter = Plotter()
+    history = History(max_points)
+    min_interval = 1 / max_hz
+    last_draw, dirty, avg = 0.0, False, 0
+
+    def render() -> None:
+        plotter.x, plotter.y = history.x, history.y
+        plotter.update_plot(avg)
+
+    while True:
+        try:
+            message = messages.get(timeout=min_interval if interactive else None)
+        except queue.Empty:
+            message = None
+
+        if message is None:
+            pass
+        elif message[0] == "game":
+            _, score, avg = message
+            history.add(avg)
+            dirty = True
+        elif message[0] == "save":
+            render()
+            plotter.save_graph(message[1])
+            replies.put(message[1])
+        elif message[0] == "close":
+            plotter.close()
+            return
+
+        if interactive:
+            now = time.monotonic()
+            if dirty and now - last_draw >= min_interval:
+                render()
+                last_draw, dirty = now, False
+            else:
+                plotter.fig.canvas.flush_events()
+
+
+class AsyncPlotter:
+    """Same Interface as Plotter ; Games are Queued & Rendered by a Separate Process
+    interactive=False Renders Nothing until save_graph (File-Only, Agg Backend)"""
+    def __init__(self, interactive:bool=True, max_hz:float=2.0, max_points:int=2000):
+        ctx = mp.get_context("spawn")
+        self.messages = ctx.Queue()
+        self.replies = ctx.Queue()
+        self.process = ctx.Process(target=plot_worker, args=(self.messages, self.replies, interactive, max_hz, max_points), daemon=True)
+        self.process.start()
+
+    def add_game(self, score:int, avg:int=-1) -> None:
+        """Queue Game's New Values ; Never Blocks on Drawing"""
+        if avg == -1:
+            avg = score
+        self.messages.put_nowait(("game", score, avg))
+
+    def save_graph(self, location:str, timeout:float=30.0) -> None:
+        """Saves Graph to Folder ; Waits for the Plotting Process to Write it"""
+        self.messages.put(("save", location))
+        try:
+            self.replies.get(timeout=timeout)
+        except queue.Empty:
+            print("Can't Save Graph, Plotting Process did not Answer.")
+
+    def close(self) -> None:
+        """Stop the Plotting Process"""
+        self.messages.put(("close",))
+        self.process.join(timeout=5)
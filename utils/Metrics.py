@@ -0,0 +1,53 @@
+import glob, os, time
+import numpy as np
+
+METRICS_DTYPE = np.dtype([
+    ("game", np.int64),
+    ("score", np.int32),
+    ("average", np.float32),
+    ("epsilon", np.float32),
+    ("learning_rate", np.float32),
+    ("loss", np.float32),
+    ("memory_size", np.int64),
+    ("frames", np.int64),
+    ("wall_time", np.float64),
+])
+
+
+class MetricsWriter:
+    """Append-Only Per-Game Metrics ; Rows are Buffered & Flushed as Fixed-Size .npy Chunks"""
+    def __init__(self, path:str, chunk_size:int=256):
+        self.path:str = path
+        os.makedirs(path, exist_ok=True)
+        self.chunk_size:int = chunk_size
+        self.buffer:np.ndarray = np.zeros(chunk_size, dtype=METRICS_DTYPE)
+        self.filled:int = 0
+        self.chunks:int = len(glob.glob(f"{path}/chunk_*.npy"))    # Resume After Existing Chunks
+        self.start_time:float = time.perf_counter()
+
+    def add(self, game:int, score:int, average:float, epsilon:float, learning_rate:float, loss:float, memory_size:int, frames:int) -> None:
+        """Record a Game ; Writes to Disk only Once per chunk_size Games"""
+        self.buffer[self.filled] = (game, score, average, epsilon, learning_rate, loss, memory_size, frames, time.perf_counter() - self.start_time)
+        self.filled += 1
+        if self.filled == self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write Buffered Rows as the Next Chunk ; Temp File + Rename so Readers Never See a Partial Chunk"""
+        if self.filled == 0:
+            return
+        location = f"{self.path}/chunk_{self.chunks:06d}.npy"
+        with open(f"{location}.tmp", "wb") as file:
+            np.save(file, self.buffer[:self.filled])
+        os.replace(f"{location}.tmp", location)
+        self.chunks += 1
+        self.filled = 0
+
+    def close(self) -> None:
+        """Flush the Last Partial Chunk"""
+        self.flush()
+
+
+def read_metrics(path:str, start_chunk:int=0) -> list[np.memmap]:
+    """Every Chunk from start_chunk on, Memory-Mapped & Nothing Copied ; Pass the Previous Chunk Count to Tail a Live Run"""
+    return [np.load(chunk, mmap_mode="r") for chunk in sorted(glob.glob(f"{path}/chunk_*.npy"))[start_chunk:]]
@@ -0,0 +1,81 @@
+import cProfile, time
+from collections import defaultdict, deque
+
+class Profiler:
+    """Opt-In Per-Stage Timing ; Monotonic Nanosecond Counters Summed per Game, Reported over a Rolling Window"""
+    def __init__(self, enabled:bool=False, window:int=20, trace:str=None, trace_start:int=0, trace_games:int=1, trace_file:str="profile_trace"):
+        self.enabled:bool = enabled
+        self.stages:dict[str,int] = defaultdict(int)                   # Current Game ; Stage -> Nanoseconds
+        self.history:deque[tuple[int,int,dict[str,int]]] = deque(maxlen=window)   # (Frames, Wall ns, Stages) per Game
+        self.game_start:int = 0
+        self.games:int = 0
+        ## Trace Capture ; "cprofile" or "torch" for trace_games Games Starting at Game trace_start
+        self.trace:str = trace
+        self.trace_start:int = trace_start
+        self.trace_games:int = trace_games
+        self.trace_file:str = trace_file
+        self.tracer = None
+
+    def tick(self) -> int:
+        """Current Monotonic Time ; 0 when Disabled"""
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def add(self, stage:str, start:int) -> int:
+        """Charge Time Since start to stage ; Returns Now so Consecutive Stages Share One Clock Read"""
+        if not self.enabled:
+            return 0
+        now = time.perf_counter_ns()
+        self.stages[stage] += now - start
+        return now
+
+    def begin_game(self) -> None:
+        """Reset the Per-Game Counters & Start a Trace if its Window Begins"""
+        if self.trace and self.games == self.trace_start:
+            self.start_trace()
+        self.stages = defaultdict(int)
+        self.game_start = time.perf_counter_ns()
+
+    def end_game(self, frames:int) -> None:
+        """Store the Game's Breakdown & Stop the Trace if its Window Ended"""
+        self.history.append((frames, time.perf_counter_ns() - self.game_start, self.stages))
+        self.games += 1
+        if self.tracer is not None and self.games == self.trace_start + self.trace_games:
+            self.stop_trace()
+
+    def close(self) -> None:
+        """Flush a Trace whose Window Outlived the Run"""
+        if self.tracer is not None:
+            self.stop_trace()
+
+    def report(self) -> str:
+        """Frames/sec & Share of Wall Time per Stage over the Rolling Window ; replay.* Stages are Part of update_agent"""
+        frames = sum(entry[0] for entry in self.history)
+        wall = sum(entry[1] for entry in self.history)
+        totals:dict[str,int] = defaultdict(int)
+        for _, _, stages in self.history:
+            for stage, ns in stages.items():
+                totals[stage] += ns
+        breakdown = " ; ".join(f"{stage} {100 * ns / wall:.1f}%" for stage, ns in sorted(totals.items(), key=lambda item: -item[1]))
+        return f"Frames/sec: {frames / max(wall, 1) * 1e9:.0f} ; {breakdown}"
+
+    def start_trace(self) -> None:
+        """Begin cProfile / torch.profiler Capture"""
+        if self.trace == "cprofile":
+            self.tracer = cProfile.Profile()
+            self.tracer.enable()
+        elif self.trace == "torch":
+            import torch.profiler
+            self.tracer = torch.profiler.profile(activities=[torch.profiler.ProfilerActivity.CPU], record_shapes=True)
+            self.tracer.start()
+
+    def stop_trace(self) -> None:
+        """End Capture & Write trace_file.prof (cProfile) or trace_file.json (Chrome Trace)"""
+        if self.trace == "cprofile":
+            self.tracer.disable()
+            self.tracer.dump_stats(f"{self.trace_file}.prof")
+            print(f"Profile saved to {self.trace_file}.prof")
+        else:
+            self.tracer.stop()
+            self.tracer.export_chrome_trace(f"{self.trace_file}.json")
+            print(f"Trace saved to {self.trace_file}.json")
+        self.tracer = None